@@ -1,6 +1,12 @@
+import atexit
+import bisect
+import hashlib
+import itertools
 import json
 import logging
 import os
+import queue
+import random
 import re
 import shutil
 import signal
@@ -8,34 +14,39 @@ import sys
 import threading
 import time
 import zipfile
+from collections import OrderedDict, deque, namedtuple
 from logging.handlers import RotatingFileHandler
+from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request, send_file, stream_with_context
 from flask_cors import CORS
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+processStartedAt = time.perf_counter()
 
 app = Flask(__name__)
-CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=False)
+CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=False, expose_headers=["X-Books-Stale", "X-Books-Version"])
 
 presenceThread = None
 
 statusLock = threading.Lock()
 configLock = threading.Lock()
-booksLock = threading.Lock()
-booksCacheLock = threading.Lock()
 
 init_event = threading.Event()
 is_running_event = threading.Event()
 should_run_event = threading.Event()
 
-stopSleepEvent = threading.Event()
+presenceWakeEvent = threading.Event()
+
+BOOKS_REFRESH_RETRY_SECONDS = 15
+BOOKS_CACHE_TTL_SECONDS = 60
+BOOKS_CACHE_MAX_ENTRIES = 8
 
-booksCache = {"timestamp": 0, "platform": None, "data": None}
+STATUS_JOURNAL_CAPACITY = 500
 
-statusInfo = {"status": ["Idle"], "message": [None], "lastUpdated": [None]}
+StatusEvent = namedtuple("StatusEvent", ["seq", "status", "message", "lastUpdated"])
+
+statusJournal = deque(maxlen=STATUS_JOURNAL_CAPACITY)
+statusSeq = 0
 
 DEFAULT_CONFIG = {
     "goodreads_id": "your_goodreads_id_here",
@@ -48,6 +59,15 @@ DEFAULT_CONFIG = {
     "update_interval": 60,
     "startByDefault": False,
     "platform": "goodreads",
+    "storygraph_browser_idle_seconds": 300,
+    "storygraph_fetch_mode": "auto",
+    "books_stale_while_revalidate": True,
+    "presence_keepalive_seconds": 300,
+    "server_mode": "production",
+    "server_threads": 16,
+    "server_timeout_seconds": 30,
+    "server_keepalive": True,
+    "cover_cache_max_mb": 64,
 }
 
 CONFIG = {}
@@ -105,12 +125,318 @@ def setupLogger() -> logging.Logger:
 logger = setupLogger()
 
 
+METRIC_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def escapeMetricLabelValue(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def formatMetricLabels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{escapeMetricLabelValue(value)}"' for key, value in pairs) + "}"
+
+
+class MetricTimer:
+    __slots__ = ("registry", "name", "labels", "startedAt")
+
+    def __init__(self, registry, name: str, labels: dict):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+        self.startedAt = 0.0
+
+    def __enter__(self):
+        self.startedAt = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.registry.observe(self.name, time.perf_counter() - self.startedAt, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: tuple = METRIC_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.descriptions = {}
+        self.counters = {}
+        self.histograms = {}
+        self.gauges = []
+
+    def describe(self, name: str, kind: str, helpText: str) -> None:
+        self.descriptions[name] = (kind, helpText)
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        bucketIndex = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bucketIndex] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+
+    def timer(self, name: str, **labels) -> MetricTimer:
+        return MetricTimer(self, name, labels)
+
+    def gauge(self, name: str, helpText: str, valueFn) -> None:
+        self.gauges.append((name, helpText, valueFn))
+
+    def render(self) -> str:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: (list(value[0]), value[1], value[2]) for key, value in self.histograms.items()}
+
+        lines = []
+        described = set()
+
+        def header(name: str, defaultKind: str) -> None:
+            if name in described:
+                return
+            described.add(name)
+            kind, helpText = self.descriptions.get(name, (defaultKind, name))
+            lines.append(f"# HELP {name} {helpText}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{formatMetricLabels(labels)} {value}")
+
+        for (name, labels), (bucketCounts, total, count) in sorted(histograms.items()):
+            header(name, "histogram")
+            cumulative = 0
+            for bound, bucketCount in zip(self.buckets + (float("inf"),), bucketCounts):
+                cumulative += bucketCount
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{formatMetricLabels(labels, (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{formatMetricLabels(labels)} {total}")
+            lines.append(f"{name}_count{formatMetricLabels(labels)} {count}")
+
+        for name, helpText, valueFn in self.gauges:
+            try:
+                value = valueFn()
+            except Exception:
+                continue
+            if value is None:
+                continue
+            lines.append(f"# HELP {name} {helpText}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {float(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+for metricName, metricKind, metricHelp in (
+    ("grrpc_http_requests_total", "counter", "API requests by endpoint, method and status."),
+    ("grrpc_http_request_duration_seconds", "histogram", "API request latency by endpoint."),
+    ("grrpc_goodreads_fetches_total", "counter", "Goodreads shelf page fetches by page kind and result."),
+    ("grrpc_goodreads_fetch_seconds", "histogram", "Goodreads shelf page fetch latency."),
+    ("grrpc_storygraph_http_fetches_total", "counter", "StoryGraph HTTP fast-path fetches by result."),
+    ("grrpc_storygraph_http_fetch_seconds", "histogram", "StoryGraph HTTP fast-path fetch latency per page or fragment."),
+    ("grrpc_storygraph_browser_launch_seconds", "histogram", "Chromium launch time for the StoryGraph browser pool."),
+    ("grrpc_storygraph_page_load_seconds", "histogram", "StoryGraph browser page load time by stage."),
+    ("grrpc_parse_seconds", "histogram", "HTML parse time by platform."),
+    ("grrpc_normalize_seconds", "histogram", "Book normalization time by platform."),
+    ("grrpc_books_cache_requests_total", "counter", "Books cache lookups by result (hit, stale, miss)."),
+    ("grrpc_presence_updates_total", "counter", "Presence loop outcomes (sent, keepalives, skipped, failed, wakeups)."),
+    ("grrpc_config_writes_total", "counter", "Config persistence attempts by result."),
+):
+    metrics.describe(metricName, metricKind, metricHelp)
+
+
+SPAN_BUFFER_SIZE = 1000
+
+spanLocal = threading.local()
+recentSpansLock = threading.Lock()
+recentSpans = deque(maxlen=SPAN_BUFFER_SIZE)
+spanIdCounter = itertools.count(1)
+
+
+def getSpanStack() -> list:
+    stack = getattr(spanLocal, "stack", None)
+    if stack is None:
+        stack = spanLocal.stack = []
+    return stack
+
+
+def getCurrentSpan():
+    stack = getattr(spanLocal, "stack", None)
+    return stack[-1] if stack else None
+
+
+# Timed stage of a scrape or presence cycle. Nests through a thread-local stack;
+# pass parent= when the work hops to a worker thread.
+class Span:
+    __slots__ = ("name", "attrs", "parent", "spanId", "parentId", "traceId", "startedAt", "startedWall")
+
+    def __init__(self, name: str, parent, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.spanId = None
+        self.parentId = None
+        self.traceId = None
+        self.startedAt = 0.0
+        self.startedWall = 0.0
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        parent = self.parent if self.parent is not None else getCurrentSpan()
+        self.spanId = next(spanIdCounter)
+        self.parentId = parent.spanId if parent is not None else None
+        self.traceId = parent.traceId if parent is not None else self.spanId
+        self.startedWall = time.time()
+        self.startedAt = time.perf_counter()
+        getSpanStack().append(self)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        durationSeconds = time.perf_counter() - self.startedAt
+        stack = getSpanStack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        elif self in stack:
+            stack.remove(self)
+
+        record = {
+            "name": self.name,
+            "traceId": self.traceId,
+            "spanId": self.spanId,
+            "parentId": self.parentId,
+            "thread": threading.current_thread().name,
+            "startedAt": self.startedWall,
+            "durationMs": round(durationSeconds * 1000, 3),
+            "attrs": self.attrs,
+            "error": f"{excType.__name__}: {excValue}" if excType is not None else None,
+        }
+        with recentSpansLock:
+            recentSpans.append(record)
+        return False
+
+
+def traceSpan(name: str, parent=None, **attrs) -> Span:
+    return Span(name, parent, attrs)
+
+
+def getRecentSpans(limit: int = 200, name: str | None = None, traceId: int | None = None) -> list[dict]:
+    with recentSpansLock:
+        spans = list(recentSpans)
+    matched = [
+        span
+        for span in reversed(spans)
+        if (name is None or span["name"] == name) and (traceId is None or span["traceId"] == traceId)
+    ]
+    return matched[:limit]
+
+
+def getSpanSummary() -> dict:
+    with recentSpansLock:
+        spans = list(recentSpans)
+
+    summary = {}
+    for span in spans:
+        entry = summary.setdefault(span["name"], {"count": 0, "errors": 0, "totalMs": 0.0, "maxMs": 0.0, "lastMs": None})
+        entry["count"] += 1
+        entry["totalMs"] += span["durationMs"]
+        entry["maxMs"] = max(entry["maxMs"], span["durationMs"])
+        entry["lastMs"] = span["durationMs"]
+        if span["error"]:
+            entry["errors"] += 1
+
+    for entry in summary.values():
+        entry["meanMs"] = round(entry["totalMs"] / entry["count"], 3)
+        entry["totalMs"] = round(entry["totalMs"], 3)
+    return summary
+
+
+EVENT_SUBSCRIBER_QUEUE_SIZE = 256
+EVENT_STREAM_KEEPALIVE_SECONDS = 15
+
+eventSubscribersLock = threading.Lock()
+eventSubscribers = []
+eventStreamStats = {"published": 0, "dropped": 0}
+
+
+def subscribeEvents() -> queue.Queue:
+    subscriberQueue = queue.Queue(maxsize=EVENT_SUBSCRIBER_QUEUE_SIZE)
+    with eventSubscribersLock:
+        eventSubscribers.append(subscriberQueue)
+    return subscriberQueue
+
+
+def unsubscribeEvents(subscriberQueue: queue.Queue) -> None:
+    with eventSubscribersLock:
+        if subscriberQueue in eventSubscribers:
+            eventSubscribers.remove(subscriberQueue)
+
+
+def publishEvent(eventType: str, data) -> None:
+    with eventSubscribersLock:
+        eventStreamStats["published"] += 1
+        for subscriberQueue in eventSubscribers:
+            try:
+                subscriberQueue.put_nowait((eventType, data))
+            except queue.Full:
+                eventStreamStats["dropped"] += 1
+
+
+def getEventStreamStats() -> dict:
+    with eventSubscribersLock:
+        data = dict(eventStreamStats)
+        data["subscribers"] = len(eventSubscribers)
+    return data
+
+
 def updateStatus(status: str, message: str | None = None) -> None:
+    global statusSeq
     ts = time.time()
     with statusLock:
-        statusInfo["status"].append(status)
-        statusInfo["message"].append(message)
-        statusInfo["lastUpdated"].append(ts)
+        statusSeq += 1
+        seq = statusSeq
+        statusJournal.append(StatusEvent(seq, status, message, ts))
+    publishEvent("status", {"seq": seq, "status": status, "message": message, "lastUpdated": ts})
+
+
+def getLatestStatusEvent() -> StatusEvent | None:
+    with statusLock:
+        return statusJournal[-1] if statusJournal else None
+
+
+def readStatusJournal(since: int | None) -> dict:
+    with statusLock:
+        latestSeq = statusSeq
+        oldestSeq = statusJournal[0].seq if statusJournal else latestSeq + 1
+
+        reset = since is not None and since > latestSeq
+        if since is None:
+            events = list(statusJournal)[-1:]
+        else:
+            cursor = 0 if reset else since
+            events = [ev for ev in statusJournal if ev.seq > cursor]
+
+    dropped = 0
+    if since is not None and not reset:
+        dropped = max(0, oldestSeq - 1 - since)
+
+    return {
+        "events": [ev._asdict() for ev in events],
+        "nextSeq": latestSeq,
+        "oldestSeq": oldestSeq,
+        "dropped": dropped,
+        "reset": reset,
+    }
 
 
 def logInfo(message: str, uiStatus: str | None = None) -> None:
@@ -140,7 +466,11 @@ def safeJsonifyError(e: Exception, code: int = 500, where: str = "unknown"):
     return jsonify({"error": msg}), code
 
 
-def buildHttpSession() -> requests.Session:
+def buildHttpSession():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     retry = Retry(
         total=3,
         backoff_factor=0.6,
@@ -154,7 +484,17 @@ def buildHttpSession() -> requests.Session:
     return session
 
 
-httpSession = buildHttpSession()
+httpSession = None
+httpSessionLock = threading.Lock()
+
+
+def getHttpSession():
+    global httpSession
+    if httpSession is None:
+        with httpSessionLock:
+            if httpSession is None:
+                httpSession = buildHttpSession()
+    return httpSession
 
 
 def findBundledPlaywrightZip(meipassDir: str) -> str | None:
@@ -172,6 +512,95 @@ def findBundledPlaywrightZip(meipassDir: str) -> str | None:
     return None
 
 
+PLAYWRIGHT_MANIFEST_NAME = ".extracted-manifest.json"
+
+
+def getZipMemberFingerprint(members: list) -> str:
+    digest = hashlib.sha256()
+    for info in sorted(members, key=lambda m: m.filename):
+        digest.update(f"{info.filename}:{info.CRC}:{info.file_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def getSafeExtractPath(targetDir: str, memberName: str) -> str | None:
+    targetPath = os.path.normpath(os.path.join(targetDir, memberName))
+    if os.path.isabs(memberName) or not targetPath.startswith(os.path.normpath(targetDir) + os.sep):
+        return None
+    return targetPath
+
+
+def findIncompleteZipMembers(members: list, targetDir: str) -> list:
+    incomplete = []
+    for info in members:
+        targetPath = getSafeExtractPath(targetDir, info.filename)
+        if targetPath is None:
+            continue
+        try:
+            if os.path.getsize(targetPath) != info.file_size:
+                incomplete.append(info)
+        except OSError:
+            incomplete.append(info)
+    return incomplete
+
+
+def extractZipMembersInParallel(zipPath: str, members: list, targetDir: str, workers: int | None = None) -> None:
+    threadState = threading.local()
+    openedZips = []
+    openedZipsLock = threading.Lock()
+
+    def getThreadZip():
+        zipRef = getattr(threadState, "zipRef", None)
+        if zipRef is None:
+            zipRef = zipfile.ZipFile(zipPath, "r")
+            threadState.zipRef = zipRef
+            with openedZipsLock:
+                openedZips.append(zipRef)
+        return zipRef
+
+    def extractMember(info) -> None:
+        targetPath = getSafeExtractPath(targetDir, info.filename)
+        if targetPath is None:
+            logWarning(f"Skipping unsafe Playwright zip member: {info.filename}")
+            return
+
+        os.makedirs(os.path.dirname(targetPath), exist_ok=True)
+        partPath = targetPath + ".part"
+        with getThreadZip().open(info, "r") as source, open(partPath, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+        unixMode = (info.external_attr >> 16) & 0o777
+        if unixMode:
+            os.chmod(partPath, unixMode)
+        os.replace(partPath, targetPath)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workerCount = workers or min(8, os.cpu_count() or 4)
+    try:
+        with ThreadPoolExecutor(max_workers=workerCount, thread_name_prefix="PlaywrightExtract") as executor:
+            for _ in executor.map(extractMember, sorted(members, key=lambda m: -m.file_size)):
+                pass
+    finally:
+        for zipRef in openedZips:
+            zipRef.close()
+
+
+def writePlaywrightManifest(manifestPath: str, fingerprint: str, complete: bool) -> None:
+    tmpPath = manifestPath + ".tmp"
+    with open(tmpPath, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "complete": complete, "timestamp": int(time.time())}, f)
+    os.replace(tmpPath, manifestPath)
+
+
+def readPlaywrightManifest(manifestPath: str) -> dict:
+    try:
+        with open(manifestPath, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except Exception:
+        return {}
+
+
 def setPlaywrightBrowserPathForPyinstaller() -> None:
     if not (getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS")):
         return
@@ -184,37 +613,71 @@ def setPlaywrightBrowserPathForPyinstaller() -> None:
 
     playwrightCacheDir = os.path.join(cacheDir, "discordrpc-playwright")
     extractedBrowsersDir = os.path.join(playwrightCacheDir, "browsers")
-    markerPath = os.path.join(playwrightCacheDir, ".extracted-ok")
-    cachedZipPath = os.path.join(playwrightCacheDir, "playwright-browsers.zip")
+    manifestPath = os.path.join(playwrightCacheDir, PLAYWRIGHT_MANIFEST_NAME)
 
     os.makedirs(playwrightCacheDir, exist_ok=True)
 
-    if not os.path.exists(markerPath):
+    for legacyName in (".extracted-ok", "playwright-browsers.zip"):
+        legacyPath = os.path.join(playwrightCacheDir, legacyName)
+        if os.path.exists(legacyPath):
+            try:
+                os.remove(legacyPath)
+            except OSError:
+                pass
+
+    with zipfile.ZipFile(bundledZipInMeipass, "r") as zipRef:
+        members = [info for info in zipRef.infolist() if not info.is_dir()]
+    fingerprint = getZipMemberFingerprint(members)
+
+    manifest = readPlaywrightManifest(manifestPath)
+    if manifest.get("fingerprint") == fingerprint:
+        pendingMembers = findIncompleteZipMembers(members, extractedBrowsersDir)
+        if pendingMembers:
+            logWarning(f"Repairing {len(pendingMembers)} missing or partial Playwright browser file(s).", uiStatus="Info")
+    else:
         if os.path.exists(extractedBrowsersDir):
             shutil.rmtree(extractedBrowsersDir, ignore_errors=True)
-        os.makedirs(extractedBrowsersDir, exist_ok=True)
+        pendingMembers = members
 
-        shutil.copy2(bundledZipInMeipass, cachedZipPath)
-        with zipfile.ZipFile(cachedZipPath, "r") as zipRef:
-            zipRef.extractall(extractedBrowsersDir)
+    if pendingMembers or not manifest.get("complete"):
+        writePlaywrightManifest(manifestPath, fingerprint, complete=False)
+        os.makedirs(extractedBrowsersDir, exist_ok=True)
 
-        with open(markerPath, "w", encoding="utf-8") as f:
-            f.write(str(int(time.time())))
+        extractStart = time.perf_counter()
+        extractZipMembersInParallel(bundledZipInMeipass, pendingMembers, extractedBrowsersDir)
+        writePlaywrightManifest(manifestPath, fingerprint, complete=True)
 
-        logInfo("Extracted Playwright browsers to cache.", uiStatus="Info")
+        extractSeconds = round(time.perf_counter() - extractStart, 2)
+        logInfo(f"Extracted {len(pendingMembers)} Playwright browser file(s) to cache in {extractSeconds}s.", uiStatus="Info")
 
     os.environ["PLAYWRIGHT_BROWSERS_PATH"] = extractedBrowsersDir
 
 
-setPlaywrightBrowserPathForPyinstaller()
+playwrightPrepareLock = threading.Lock()
+playwrightReadyEvent = threading.Event()
+
+
+def preparePlaywrightBrowsers() -> None:
+    with playwrightPrepareLock:
+        if playwrightReadyEvent.is_set():
+            return
+        try:
+            setPlaywrightBrowserPathForPyinstaller()
+        except Exception as e:
+            logWarning(f"Preparing Playwright browsers failed; will retry on the next StoryGraph fetch: {e}", uiStatus=None)
+            raise
+        playwrightReadyEvent.set()
 
 
 def load_config() -> dict:
-    global CONFIG
+    global CONFIG, configLastSavedContent
     try:
         if os.path.exists(configPath):
             with open(configPath, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
+                configText = f.read()
+            cfg = json.loads(configText)
+            with configSaveLock:
+                configLastSavedContent = configText
 
             changed = False
             for k, v in DEFAULT_CONFIG.items():
@@ -243,20 +706,108 @@ def load_config() -> dict:
         return CONFIG
 
 
+CONFIG_SAVE_DEBOUNCE_SECONDS = 0.5
+
+configSaveLock = threading.Lock()
+configWriteLock = threading.Lock()
+configSaveDirty = False
+configSaveTimer = None
+configLastSavedContent = None
+configSaveStats = {"requested": 0, "coalesced": 0, "written": 0, "skippedUnchanged": 0, "failures": 0, "lastSavedAt": None}
+previousSignalHandlers = {}
+
+
 def save_config_internal() -> None:
-    try:
-        with configLock:
-            cfg = dict(CONFIG)
+    global configLastSavedContent
 
-        tmpPath = configPath + ".tmp"
-        with open(tmpPath, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=4)
-        os.replace(tmpPath, configPath)
+    try:
+        with configWriteLock:
+            with configLock:
+                configText = json.dumps(CONFIG, indent=4)
+
+            with configSaveLock:
+                if configText == configLastSavedContent:
+                    configSaveStats["skippedUnchanged"] += 1
+                    metrics.inc("grrpc_config_writes_total", result="skipped")
+                    return
+
+            tmpPath = configPath + ".tmp"
+            with open(tmpPath, "w", encoding="utf-8") as f:
+                f.write(configText)
+            os.replace(tmpPath, configPath)
+
+            with configSaveLock:
+                configLastSavedContent = configText
+                configSaveStats["written"] += 1
+                configSaveStats["lastSavedAt"] = time.time()
+            metrics.inc("grrpc_config_writes_total", result="written")
     except Exception as e:
+        with configSaveLock:
+            configSaveStats["failures"] += 1
+        metrics.inc("grrpc_config_writes_total", result="failed")
         logError(f"Failed to save config: {e}", uiStatus="Error", exc=e)
 
 
-CONFIG = load_config()
+def scheduleConfigSave() -> None:
+    global configSaveDirty, configSaveTimer
+
+    with configSaveLock:
+        configSaveStats["requested"] += 1
+        if configSaveDirty:
+            configSaveStats["coalesced"] += 1
+            return
+        configSaveDirty = True
+        configSaveTimer = threading.Timer(CONFIG_SAVE_DEBOUNCE_SECONDS, flushConfigSave)
+        configSaveTimer.daemon = True
+        configSaveTimer.name = "ConfigSaveTimer"
+        configSaveTimer.start()
+
+
+def flushConfigSave() -> None:
+    global configSaveDirty, configSaveTimer
+
+    with configSaveLock:
+        timer = configSaveTimer
+        wasDirty = configSaveDirty
+        configSaveTimer = None
+        configSaveDirty = False
+
+    if timer is not None and timer is not threading.current_thread():
+        timer.cancel()
+    if wasDirty:
+        save_config_internal()
+
+
+def flushConfigSaveOnSignal(signum, frame) -> None:
+    # Flush off the main thread so a signal that lands while it holds a config lock cannot deadlock.
+    flushThread = threading.Thread(target=flushConfigSave, daemon=True, name="ConfigFlushThread")
+    flushThread.start()
+    flushThread.join(timeout=5)
+
+    previousHandler = previousSignalHandlers.get(signum, signal.SIG_DFL)
+    if callable(previousHandler):
+        previousHandler(signum, frame)
+    elif previousHandler == signal.SIG_DFL:
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+
+
+def installConfigFlushHandlers() -> None:
+    atexit.register(flushConfigSave)
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        previousSignalHandlers[signum] = signal.getsignal(signum)
+        signal.signal(signum, flushConfigSaveOnSignal)
+
+
+def getConfigSaveStats() -> dict:
+    with configSaveLock:
+        data = dict(configSaveStats)
+        data["dirty"] = configSaveDirty
+    return data
+
 
 
 def normalizeConfigUpdateKeys(updateDict: dict) -> dict:
@@ -284,7 +835,45 @@ def clampConfigValues(cfg: dict) -> dict:
         intervalValue = 60
     cleaned["update_interval"] = max(5, min(600, intervalValue))
 
-    for boolKey in ("minimizeToTray", "startOnStartup", "startByDefault"):
+    if "storygraph_browser_idle_seconds" in cleaned:
+        try:
+            idleValue = int(cleaned.get("storygraph_browser_idle_seconds", 300))
+        except Exception:
+            idleValue = 300
+        cleaned["storygraph_browser_idle_seconds"] = max(0, min(3600, idleValue))
+
+    if "presence_keepalive_seconds" in cleaned:
+        try:
+            keepaliveValue = int(cleaned.get("presence_keepalive_seconds", 300))
+        except Exception:
+            keepaliveValue = 300
+        cleaned["presence_keepalive_seconds"] = max(0, min(3600, keepaliveValue))
+
+    if "storygraph_fetch_mode" in cleaned:
+        fetchMode = (cleaned.get("storygraph_fetch_mode") or "auto").lower().strip()
+        if fetchMode not in ("auto", "http", "browser"):
+            fetchMode = "auto"
+        cleaned["storygraph_fetch_mode"] = fetchMode
+
+    if "server_mode" in cleaned:
+        serverMode = (cleaned.get("server_mode") or "production").lower().strip()
+        if serverMode not in ("production", "development"):
+            serverMode = "production"
+        cleaned["server_mode"] = serverMode
+
+    for intKey, defaultValue, minValue, maxValue in (
+        ("server_threads", 16, 4, 64),
+        ("server_timeout_seconds", 30, 5, 300),
+        ("cover_cache_max_mb", 64, 8, 1024),
+    ):
+        if intKey in cleaned:
+            try:
+                intValue = int(cleaned.get(intKey, defaultValue))
+            except Exception:
+                intValue = defaultValue
+            cleaned[intKey] = max(minValue, min(maxValue, intValue))
+
+    for boolKey in ("minimizeToTray", "startOnStartup", "startByDefault", "books_stale_while_revalidate", "server_keepalive"):
         if boolKey in cleaned:
             cleaned[boolKey] = bool(cleaned[boolKey])
 
@@ -295,24 +884,56 @@ def clampConfigValues(cfg: dict) -> dict:
     return cleaned
 
 
-currentBook = None
-currentIsbn = None
-books = {}
+BookSnapshot = namedtuple("BookSnapshot", ["version", "books", "currentIsbn", "currentBook"])
+
+# Readers just grab the current snapshot reference; writers build a fresh snapshot under the
+# write lock and swap it in. A published snapshot's books dict is never mutated.
+bookSnapshotWriteLock = threading.Lock()
+bookSnapshot = BookSnapshot(0, {}, None, None)
+
+
+def getBookSnapshot() -> BookSnapshot:
+    return bookSnapshot
+
+
+def swapBookSnapshot(buildNext) -> tuple[BookSnapshot, BookSnapshot]:
+    global bookSnapshot
+    with bookSnapshotWriteLock:
+        previous = bookSnapshot
+        nextState = buildNext(previous)
+        if nextState is None:
+            return previous, previous
+        nextBooks, nextIsbn = nextState
+        nextBooks = nextBooks if nextBooks is not None else {}
+        bookSnapshot = BookSnapshot(previous.version + 1, nextBooks, nextIsbn, nextBooks.get(nextIsbn) if nextIsbn else None)
+        return previous, bookSnapshot
+
+
+def installScrapedBooks(scraped: dict) -> BookSnapshot:
+    def buildNext(previous: BookSnapshot):
+        if previous.currentIsbn and previous.currentIsbn in scraped:
+            return scraped, previous.currentIsbn
+        return scraped, next(iter(scraped.values()))["isbn"]
+
+    previous, snapshot = swapBookSnapshot(buildNext)
+    if snapshot.currentIsbn != previous.currentIsbn:
+        with configLock:
+            CONFIG["current_isbn"] = snapshot.currentIsbn
+        scheduleConfigSave()
+    return snapshot
+
+
+def getBookSnapshotStats() -> dict:
+    snapshot = getBookSnapshot()
+    return {"version": snapshot.version, "books": len(snapshot.books), "currentIsbn": snapshot.currentIsbn}
 
 
 def applyConfigToRuntimeState() -> None:
-    global currentIsbn, currentBook
     with configLock:
-        currentIsbn = CONFIG.get("current_isbn")
-
-    with booksLock:
-        if currentIsbn and currentIsbn in books:
-            currentBook = books[currentIsbn]
-        else:
-            currentBook = None
+        configIsbn = CONFIG.get("current_isbn")
 
+    swapBookSnapshot(lambda previous: (previous.books, configIsbn))
 
-applyConfigToRuntimeState()
 
 
 @app.errorhandler(Exception)
@@ -347,53 +968,166 @@ def getPlatformConfigSnapshot() -> dict:
             "storygraph_username": (CONFIG.get("storygraph_username") or "").strip(),
             "discord_app_id": (CONFIG.get("discord_app_id") or "").strip(),
             "update_interval": CONFIG.get("update_interval", 60),
+            "storygraph_browser_idle_seconds": CONFIG.get("storygraph_browser_idle_seconds", 300),
+            "storygraph_fetch_mode": (CONFIG.get("storygraph_fetch_mode") or "auto").lower(),
+            "books_stale_while_revalidate": bool(CONFIG.get("books_stale_while_revalidate", True)),
+            "presence_keepalive_seconds": CONFIG.get("presence_keepalive_seconds", 300),
         }
     return snapshot
 
 
+class RowMemo:
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key) -> dict | None:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+        return dict(value)
+
+    def put(self, key, value: dict) -> None:
+        with self.lock:
+            self.entries[key] = dict(value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def getStats(self) -> dict:
+        with self.lock:
+            data = dict(self.stats)
+            data["size"] = len(self.entries)
+        return data
+
+
+goodreadsRowMemo = RowMemo()
+storygraphRowMemo = RowMemo()
+
+
+def getRowMarkupHash(markup: str) -> str:
+    return hashlib.blake2b(markup.encode("utf-8"), digest_size=16).hexdigest()
+
+
+STORYGRAPH_DIV_TAG_RE = re.compile(r"<div\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>|</div\s*>", re.IGNORECASE)
+STORYGRAPH_PANE_CLASS_RE = re.compile(r"\bclass=[\"'](?:[^\"']*\s)?book-pane(?![\w-])", re.IGNORECASE)
+STORYGRAPH_PANE_ID_RE = re.compile(r"\bdata-book-id=[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+
+def splitStoryGraphPaneChunks(htmlText: str) -> list[tuple[str, str]] | None:
+    paneChunks = []
+    depth = 0
+    paneStart = None
+    paneDepth = None
+    paneId = None
+
+    for tagMatch in STORYGRAPH_DIV_TAG_RE.finditer(htmlText):
+        tagText = tagMatch.group(0)
+        if tagText[1] == "/":
+            depth -= 1
+            if paneStart is not None and depth == paneDepth:
+                paneChunks.append((paneId, htmlText[paneStart:tagMatch.end()]))
+                paneStart = None
+            continue
+
+        if STORYGRAPH_PANE_CLASS_RE.search(tagText):
+            idMatch = STORYGRAPH_PANE_ID_RE.search(tagText)
+            if idMatch:
+                if paneStart is not None:
+                    return None
+                paneStart = tagMatch.start()
+                paneDepth = depth
+                paneId = idMatch.group(1).strip()
+        depth += 1
+
+    if paneStart is not None:
+        return None
+    if any("<!--" in paneMarkup for _, paneMarkup in paneChunks):
+        return None
+    if len(paneChunks) != len(STORYGRAPH_PANE_CLASS_RE.findall(htmlText)):
+        return None
+    return paneChunks
+
+
 def parseStoryGraphCurrentReadsHtml(htmlText: str) -> list[dict]:
-    soup = BeautifulSoup(htmlText, "html.parser")
+    from bs4 import BeautifulSoup
+
+    paneChunks = splitStoryGraphPaneChunks(htmlText)
+    if paneChunks is None:
+        with storygraphFetchStatsLock:
+            storygraphFetchStats["paneSplitFallbacks"] += 1
+        return parseStoryGraphBookPanes(BeautifulSoup(htmlText, "html.parser"))
+
+    memoKeys = [(paneId, getRowMarkupHash(paneMarkup)) for paneId, paneMarkup in paneChunks]
+    parsedBooks = [storygraphRowMemo.get(memoKey) for memoKey in memoKeys]
+    missedIndexes = [index for index, parsedBook in enumerate(parsedBooks) if parsedBook is None]
+
+    if missedIndexes:
+        missedSoup = BeautifulSoup("".join(paneChunks[index][1] for index in missedIndexes), "html.parser")
+        missedPanes = missedSoup.select("div.book-pane[data-book-id]")
+        if len(missedPanes) != len(missedIndexes):
+            return parseStoryGraphBookPanes(BeautifulSoup(htmlText, "html.parser"))
+        for index, bookPane in zip(missedIndexes, missedPanes):
+            parsedBook = parseStoryGraphBookPane(bookPane)
+            storygraphRowMemo.put(memoKeys[index], parsedBook)
+            parsedBooks[index] = parsedBook
+
+    return parsedBooks
+
+
+def parseStoryGraphBookPanes(soup) -> list[dict]:
     parsedBooks = []
-    bookPanes = soup.select("div.book-pane[data-book-id]")
+    for bookPane in soup.select("div.book-pane[data-book-id]"):
+        memoKey = ((bookPane.get("data-book-id") or "").strip(), getRowMarkupHash(str(bookPane)))
+        parsedBook = storygraphRowMemo.get(memoKey)
+        if parsedBook is None:
+            parsedBook = parseStoryGraphBookPane(bookPane)
+            storygraphRowMemo.put(memoKey, parsedBook)
+        parsedBooks.append(parsedBook)
+    return parsedBooks
 
-    for bookPane in bookPanes:
-        bookId = (bookPane.get("data-book-id") or "").strip()
 
-        titleLink = bookPane.select_one('h3 a[href^="/books/"]')
-        title = titleLink.get_text(strip=True) if titleLink else None
-        bookPath = titleLink.get("href") if titleLink else None
+def parseStoryGraphBookPane(bookPane) -> dict:
+    bookId = (bookPane.get("data-book-id") or "").strip()
 
-        authorLink = bookPane.select_one('a[href^="/authors/"]')
-        author = authorLink.get_text(strip=True) if authorLink else None
+    titleLink = bookPane.select_one('h3 a[href^="/books/"]')
+    title = titleLink.get_text(strip=True) if titleLink else None
+    bookPath = titleLink.get("href") if titleLink else None
 
-        seriesLinks = bookPane.select('p a[href^="/series/"]')
-        seriesName = seriesLinks[0].get_text(strip=True) if len(seriesLinks) >= 1 else None
-        seriesNumber = seriesLinks[1].get_text(strip=True) if len(seriesLinks) >= 2 else None
+    authorLink = bookPane.select_one('a[href^="/authors/"]')
+    author = authorLink.get_text(strip=True) if authorLink else None
 
-        coverImg = bookPane.select_one("img")
-        coverUrl = coverImg.get("src") if coverImg else None
+    seriesLinks = bookPane.select('p a[href^="/series/"]')
+    seriesName = seriesLinks[0].get_text(strip=True) if len(seriesLinks) >= 1 else None
+    seriesNumber = seriesLinks[1].get_text(strip=True) if len(seriesLinks) >= 2 else None
 
-        startedDate = None
-        for pTag in bookPane.select("p"):
-            textValue = pTag.get_text(" ", strip=True)
-            if "Started " in textValue:
-                startedDate = textValue.split("Started ", 1)[1].strip()
-                break
+    coverImg = bookPane.select_one("img")
+    coverUrl = coverImg.get("src") if coverImg else None
 
-        parsedBooks.append(
-            {
-                "bookId": bookId,
-                "title": title,
-                "author": author,
-                "bookPath": bookPath,
-                "coverUrl": coverUrl,
-                "startedDate": startedDate,
-                "seriesName": seriesName,
-                "seriesNumber": seriesNumber,
-            }
-        )
+    startedDate = None
+    for pTag in bookPane.select("p"):
+        textValue = pTag.get_text(" ", strip=True)
+        if "Started " in textValue:
+            startedDate = textValue.split("Started ", 1)[1].strip()
+            break
 
-    return parsedBooks
+    return {
+        "bookId": bookId,
+        "title": title,
+        "author": author,
+        "bookPath": bookPath,
+        "coverUrl": coverUrl,
+        "startedDate": startedDate,
+        "seriesName": seriesName,
+        "seriesNumber": seriesNumber,
+    }
 
 
 def chooseStableBookKey(storygraphBook: dict) -> str:
@@ -431,269 +1165,1804 @@ def normalizeStorygraphBooksToDict(storygraphBooksList: list[dict]) -> dict:
     return normalized
 
 
-def get_books() -> dict | None:
-    cfg = getPlatformConfigSnapshot()
-    platform = cfg["platform"]
+STORYGRAPH_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
+
+
+# Playwright's sync API is bound to the thread that started it, so the warm browser lives on
+# one worker thread and request threads hand it jobs through a queue.
+class StoryGraphBrowserPool:
+    def __init__(self, idleSeconds: int = 300, maxPageUses: int = 25):
+        self.idleSeconds = idleSeconds
+        self.maxPageUses = maxPageUses
+
+        self.jobQueue = queue.Queue()
+        self.workerLock = threading.Lock()
+        self.workerThread = None
+
+        self.statsLock = threading.Lock()
+        self.stats = {
+            "launches": 0,
+            "relaunches": 0,
+            "idleShutdowns": 0,
+            "jobs": 0,
+            "jobFailures": 0,
+            "pagesCreated": 0,
+            "pageReuses": 0,
+            "contextsCreated": 0,
+            "lastLaunchSeconds": None,
+            "lastUsed": None,
+        }
 
-    if platform == "goodreads":
-        goodreadsId = cfg["goodreads_id"]
-        if not goodreadsId:
-            logWarning("Goodreads ID missing.", uiStatus="Error")
-            return None
+        # Owned by the worker thread only.
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.contextToken = None
+        self.page = None
+        self.pageUses = 0
+
+    def bumpStat(self, key: str, amount: int = 1) -> None:
+        with self.statsLock:
+            self.stats[key] += amount
+
+    def getStats(self) -> dict:
+        with self.statsLock:
+            data = dict(self.stats)
+        data["browserAlive"] = self.browser is not None
+        data["workerAlive"] = bool(self.workerThread and self.workerThread.is_alive())
+        data["idleSeconds"] = self.idleSeconds
+        data["queuedJobs"] = self.jobQueue.qsize()
+        return data
+
+    def ensureWorker(self) -> None:
+        with self.workerLock:
+            if self.workerThread is None or not self.workerThread.is_alive():
+                self.workerThread = threading.Thread(
+                    target=self.workerLoop, daemon=True, name="StoryGraphBrowserThread"
+                )
+                self.workerThread.start()
+
+    def run(self, rememberUserToken: str | None, jobFn, timeoutSeconds: float = 90):
+        self.ensureWorker()
+        job = {
+            "token": rememberUserToken or "",
+            "fn": jobFn,
+            "result": None,
+            "error": None,
+            "done": threading.Event(),
+            "parentSpan": getCurrentSpan(),
+            "queuedAt": time.perf_counter(),
+        }
+        self.jobQueue.put(job)
 
-        url = f"https://www.goodreads.com/review/list/{goodreadsId}?shelf=currently-reading"
-        headers = {"User-Agent": "Mozilla/5.0"}
+        if not job["done"].wait(timeout=timeoutSeconds):
+            raise TimeoutError(f"StoryGraph browser job timed out after {timeoutSeconds}s")
+        if job["error"] is not None:
+            raise job["error"]
+        return job["result"]
 
-        logInfo(f"Fetching Goodreads currently-reading for user {goodreadsId}.", uiStatus="Info")
+    def shutdown(self, timeoutSeconds: float = 5) -> None:
+        workerThread = self.workerThread
+        if workerThread is None or not workerThread.is_alive():
+            return
+        self.jobQueue.put(None)
+        workerThread.join(timeout=timeoutSeconds)
 
+    def workerLoop(self) -> None:
+        while True:
+            waitTimeout = self.idleSeconds if (self.browser is not None and self.idleSeconds > 0) else None
+            try:
+                job = self.jobQueue.get(timeout=waitTimeout)
+            except queue.Empty:
+                logInfo("StoryGraph browser idle; shutting it down.", uiStatus=None)
+                self.bumpStat("idleShutdowns")
+                self.closeBrowser()
+                continue
+
+            if job is None:
+                self.closeBrowser()
+                return
+
+            self.runJob(job)
+
+            if self.idleSeconds <= 0:
+                self.closeBrowser()
+
+    def runJob(self, job: dict) -> None:
+        self.bumpStat("jobs")
+        queueWaitMs = round((time.perf_counter() - job["queuedAt"]) * 1000, 3)
         try:
-            response = httpSession.get(url, headers=headers, timeout=10)
+            with traceSpan("storygraph.browser_job", parent=job["parentSpan"], queueWaitMs=queueWaitMs) as span:
+                for attempt in range(2):
+                    span.set(attempts=attempt + 1)
+                    try:
+                        with traceSpan("storygraph.acquire_page"):
+                            page = self.acquirePage(job["token"])
+                        job["result"] = job["fn"](page)
+                        self.releasePage()
+                        return
+                    except Exception as e:
+                        self.closePage()
+                        if attempt == 0 and not self.isBrowserHealthy():
+                            logWarning(f"StoryGraph browser unhealthy ({e}); relaunching.", uiStatus=None)
+                            self.bumpStat("relaunches")
+                            self.closeBrowser()
+                            continue
+                        raise
         except Exception as e:
-            logError(f"Goodreads request failed: {e}", uiStatus="Error", exc=e)
-            return None
+            self.bumpStat("jobFailures")
+            job["error"] = e
+        finally:
+            with self.statsLock:
+                self.stats["lastUsed"] = time.time()
+            job["done"].set()
 
-        if response.status_code != 200:
-            logError(f"Goodreads fetch failed: {response.status_code} {response.reason}", uiStatus="Error")
-            return None
+    def isBrowserHealthy(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        bookTable = soup.find("table", {"id": "books"})
-        if not bookTable:
-            logError("Goodreads page parsed but no books table found.", uiStatus="Error")
-            return None
+    def launchBrowser(self) -> None:
+        self.closeBrowser()
+        launchStart = time.perf_counter()
 
-        rows = bookTable.find_all("tr", {"id": lambda x: x and x.startswith("review_")})
-        if not rows:
-            logWarning("Goodreads books table found but no review rows.", uiStatus="Error")
-            return None
+        with traceSpan("storygraph.browser_launch"):
+            from playwright.sync_api import sync_playwright
 
-        found = {}
-        for row in rows:
-            try:
-                titleCell = row.find("td", class_="field title")
-                authorCell = row.find("td", class_="field author")
-                coverCell = row.find("td", class_="field cover")
-                dateCell = row.find("td", class_="field date_started")
-                isbnCell = row.find("td", class_="field isbn")
-
-                title = safeText(titleCell.find("a") if titleCell else None) or "Unknown Title"
-                author = safeText(authorCell.find("a") if authorCell else None) or "Unknown Author"
-                coverArt = sanitizeCover(
-                    (coverCell.find("img")["src"] if coverCell and coverCell.find("img") else None)
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=True)
+
+        launchElapsed = time.perf_counter() - launchStart
+        metrics.observe("grrpc_storygraph_browser_launch_seconds", launchElapsed)
+        launchSeconds = round(launchElapsed, 3)
+        with self.statsLock:
+            self.stats["launches"] += 1
+            self.stats["lastLaunchSeconds"] = launchSeconds
+        logInfo(f"StoryGraph browser launched in {launchSeconds}s.", uiStatus=None)
+
+    def acquirePage(self, rememberUserToken: str):
+        if not self.isBrowserHealthy():
+            self.launchBrowser()
+
+        if self.context is None or self.contextToken != rememberUserToken:
+            self.closeContext()
+            self.context = self.browser.new_context(
+                viewport={"width": 1280, "height": 720},
+                user_agent=STORYGRAPH_USER_AGENT,
+            )
+            if rememberUserToken and rememberUserToken != "PASTE_VALUE_HERE":
+                self.context.add_cookies(
+                    [
+                        {
+                            "name": "remember_user_token",
+                            "value": rememberUserToken,
+                            "domain": "app.thestorygraph.com",
+                            "path": "/",
+                            "httpOnly": True,
+                            "secure": True,
+                            "sameSite": "Lax",
+                        }
+                    ]
                 )
+            self.contextToken = rememberUserToken
+            self.bumpStat("contextsCreated")
 
-                startSpan = dateCell.find("span", class_="date_started_value") if dateCell else None
-                startDate = safeText(startSpan)
-
-                isbnVal = None
-                if isbnCell:
-                    valDiv = isbnCell.find("div", class_="value")
-                    txt = safeText(valDiv)
-                    if txt:
-                        isbnVal = txt
-
-                isbn = isbnVal if isbnVal else f"noisbn-{title}-{author}"
-
-                found[isbn] = {
-                    "isbn": isbn,
-                    "title": title,
-                    "author": author,
-                    "coverArt": coverArt,
-                    "startDate": startDate,
-                    "platform": "goodreads",
-                    "bookUrl": url,
-                }
-            except Exception as rowErr:
-                logWarning(f"Failed to parse a Goodreads row: {rowErr}")
+        if self.page is None or self.page.is_closed():
+            self.page = self.context.new_page()
+            self.pageUses = 0
+            self.bumpStat("pagesCreated")
+        else:
+            self.bumpStat("pageReuses")
 
-        if not found:
-            logWarning("Goodreads parse succeeded but produced 0 books.", uiStatus="Error")
-            return None
+        return self.page
 
-        logInfo(f"Fetched {len(found)} book(s) from Goodreads.", uiStatus="Active")
-        return found
+    def releasePage(self) -> None:
+        self.pageUses += 1
+        if self.pageUses >= self.maxPageUses:
+            self.closePage()
 
-    if platform == "storygraph":
-        storygraphUsername = cfg["storygraph_username"]
-        if not storygraphUsername:
-            logWarning("StoryGraph username missing.", uiStatus="Error")
-            return None
+    def closePage(self) -> None:
+        if self.page is not None:
+            try:
+                self.page.close()
+            except Exception:
+                pass
+        self.page = None
+        self.pageUses = 0
 
-        url = f"https://app.thestorygraph.com/currently-reading/{storygraphUsername}"
+    def closeContext(self) -> None:
+        self.closePage()
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+        self.context = None
+        self.contextToken = None
 
-        with configLock:
-            rememberUserToken = (CONFIG.get("storygraph_remember_user_token") or "").strip()
+    def closeBrowser(self) -> None:
+        self.closeContext()
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+        self.browser = None
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+        self.playwright = None
+
+
+storygraphBrowserPool = StoryGraphBrowserPool()
+
+
+STORYGRAPH_BOOK_SELECTOR = "div.book-pane[data-book-id]"
+STORYGRAPH_MORE_CONTENT_SELECTOR = (
+    'turbo-frame[src]:not([complete]), turbo-frame[busy], a[rel="next"], .pagination a.next_page, '
+    '[data-controller~="infinite-scroll"][aria-busy="true"]'
+)
+STORYGRAPH_SCROLL_JS = """([bookSelector, moreSelector]) => {
+    const root = document.scrollingElement || document.documentElement;
+    window.scrollTo(0, root.scrollHeight);
+    return {
+        count: document.querySelectorAll(bookSelector).length,
+        atBottom: root.scrollTop + window.innerHeight >= root.scrollHeight - 4,
+        hasMore: !!document.querySelector(moreSelector),
+    };
+}"""
+STORYGRAPH_GROWTH_JS = "([bookSelector, previousCount]) => document.querySelectorAll(bookSelector).length > previousCount"
+
+storygraphFetchStatsLock = threading.Lock()
+storygraphFetchStats = {
+    "lastScrollRounds": None,
+    "lastScrollBooks": None,
+    "lastScrollSeconds": None,
+    "scrollCeilingHits": 0,
+    "httpFastPathHits": 0,
+    "browserFetches": 0,
+    "browserFallbacks": 0,
+    "lastFetchPath": None,
+    "paneSplitFallbacks": 0,
+}
 
-        logInfo(f"Fetching StoryGraph currently-reading for user {storygraphUsername}.", uiStatus="Info")
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except Exception as e:
-            logError(f"Playwright import failed: {e}", uiStatus="Error", exc=e)
-            return None
+def scrollStoryGraphUntilStable(
+    page,
+    maxRounds: int = 30,
+    initialTimeoutMs: int = 5000,
+    growthTimeoutMs: int = 1200,
+) -> tuple[int, int, bool]:
+    try:
+        page.wait_for_selector(STORYGRAPH_BOOK_SELECTOR, timeout=initialTimeoutMs)
+    except Exception:
+        pass
+
+    selectors = [STORYGRAPH_BOOK_SELECTOR, STORYGRAPH_MORE_CONTENT_SELECTOR]
+    state = page.evaluate(STORYGRAPH_SCROLL_JS, selectors)
+    rounds = 0
+
+    while rounds < maxRounds:
+        if state["atBottom"] and not state["hasMore"]:
+            return state["count"], rounds, False
 
-        htmlText = None
+        rounds += 1
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    viewport={"width": 1280, "height": 720},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-                )
+            page.wait_for_function(
+                STORYGRAPH_GROWTH_JS,
+                arg=[STORYGRAPH_BOOK_SELECTOR, state["count"]],
+                timeout=growthTimeoutMs,
+            )
+        except Exception:
+            return state["count"], rounds, False
 
-                if rememberUserToken and rememberUserToken != "PASTE_VALUE_HERE":
-                    context.add_cookies(
-                        [
-                            {
-                                "name": "remember_user_token",
-                                "value": rememberUserToken,
-                                "domain": "app.thestorygraph.com",
-                                "path": "/",
-                                "httpOnly": True,
-                                "secure": True,
-                                "sameSite": "Lax",
-                            }
-                        ]
-                    )
-
-                page = context.new_page()
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-                if "/users/sign_in" in page.url:
-                    logWarning(
-                        "StoryGraph requires login or list is private. Add remember_user_token or make profile public.",
-                        uiStatus="Error",
-                    )
-                    browser.close()
-                    return None
+        state = page.evaluate(STORYGRAPH_SCROLL_JS, selectors)
 
-                page.wait_for_timeout(1500)
-                for _ in range(10):
-                    page.mouse.wheel(0, 2000)
-                    time.sleep(0.5)
+    return state["count"], rounds, True
 
-                htmlText = page.content()
-                browser.close()
 
-        except Exception as e:
-            logError(f"StoryGraph Playwright fetch failed: {e}", uiStatus="Error", exc=e)
-            return None
+def getStoryGraphFetchStats() -> dict:
+    with storygraphFetchStatsLock:
+        return dict(storygraphFetchStats)
 
-        if not htmlText:
-            logWarning("StoryGraph fetch returned empty HTML.", uiStatus="Error")
-            return None
 
-        storygraphList = parseStoryGraphCurrentReadsHtml(htmlText)
-        if not storygraphList:
-            logWarning("StoryGraph parsed 0 books.", uiStatus="Error")
-            return None
+def fetchStoryGraphHtmlWithBrowser(url: str, rememberUserToken: str, idleSeconds: int) -> tuple[str | None, bool]:
+    def loadPage(page):
+        with traceSpan("storygraph.goto"), metrics.timer("grrpc_storygraph_page_load_seconds", stage="goto"):
+            page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-        normalizedDict = normalizeStorygraphBooksToDict(storygraphList)
-        if not normalizedDict:
-            logWarning("StoryGraph normalize produced 0 books.", uiStatus="Error")
-            return None
+        if "/users/sign_in" in page.url:
+            return None, True
 
-        logInfo(f"Fetched {len(normalizedDict)} book(s) from StoryGraph.", uiStatus="Active")
-        return normalizedDict
+        scrollStart = time.perf_counter()
+        with traceSpan("storygraph.scroll") as span:
+            bookCount, rounds, hitCeiling = scrollStoryGraphUntilStable(page)
+            span.set(rounds=rounds, books=bookCount, hitCeiling=hitCeiling)
+        scrollElapsed = time.perf_counter() - scrollStart
+        metrics.observe("grrpc_storygraph_page_load_seconds", scrollElapsed, stage="scroll")
+        scrollSeconds = round(scrollElapsed, 3)
 
-    logError(f"Unknown platform: {platform}", uiStatus="Error")
-    return None
+        with storygraphFetchStatsLock:
+            storygraphFetchStats["lastScrollRounds"] = rounds
+            storygraphFetchStats["lastScrollBooks"] = bookCount
+            storygraphFetchStats["lastScrollSeconds"] = scrollSeconds
+            if hitCeiling:
+                storygraphFetchStats["scrollCeilingHits"] += 1
 
+        if hitCeiling:
+            logWarning(f"StoryGraph scroll hit the {rounds}-round ceiling with {bookCount} book(s) loaded.", uiStatus=None)
+        else:
+            logInfo(f"StoryGraph scroll settled after {rounds} round(s) with {bookCount} book(s) in {scrollSeconds}s.", uiStatus=None)
 
-def getBooksCached(ttlSeconds: int = 60) -> dict | None:
-    cfg = getPlatformConfigSnapshot()
-    platform = cfg["platform"]
-    now = time.time()
+        with traceSpan("storygraph.content") as span, metrics.timer("grrpc_storygraph_page_load_seconds", stage="content"):
+            htmlText = page.content()
+            span.set(bytes=len(htmlText))
+        return htmlText, False
 
-    with booksCacheLock:
-        if (
-            booksCache["data"] is not None
-            and booksCache["platform"] == platform
-            and (now - booksCache["timestamp"]) < ttlSeconds
-        ):
-            return booksCache["data"]
-
-    scraped = get_books()
-    with booksCacheLock:
-        booksCache["timestamp"] = now
-        booksCache["platform"] = platform
-        booksCache["data"] = scraped
-    return scraped
+    preparePlaywrightBrowsers()
+    storygraphBrowserPool.idleSeconds = idleSeconds
+    return storygraphBrowserPool.run(rememberUserToken, loadPage)
 
 
-@app.route("/api/hello")
-def hello():
-    try:
-        updateStatus("Info", "Hello ping")
-        return jsonify({"message": "Hello from Flask!"})
-    except Exception as e:
-        return safeJsonifyError(e, 500, "hello")
+def isStoryGraphSignInUrl(url: str | None) -> bool:
+    return bool(url) and "/users/sign_in" in url
 
 
-@app.route("/api/health", methods=["GET"])
-def health():
-    try:
-        cfg = getPlatformConfigSnapshot()
-        with statusLock:
-            lastStatus = statusInfo["status"][-1] if statusInfo["status"] else None
-            lastMessage = statusInfo["message"][-1] if statusInfo["message"] else None
-            lastUpdated = statusInfo["lastUpdated"][-1] if statusInfo["lastUpdated"] else None
+def isStoryGraphListFragmentUrl(fragmentUrl: str, listUrl: str) -> bool:
+    fragment = urlparse(fragmentUrl)
+    listing = urlparse(listUrl)
+    listPath = listing.path.rstrip("/")
+    fragmentPath = fragment.path.rstrip("/")
+    return fragment.netloc == listing.netloc and (fragmentPath == listPath or fragmentPath.startswith(f"{listPath}/"))
 
-        data = {
-            "ok": True,
-            "platform": cfg["platform"],
-            "presenceRequested": should_run_event.is_set(),
-            "presenceRunning": is_running_event.is_set(),
-            "playwrightBrowsersPath": os.environ.get("PLAYWRIGHT_BROWSERS_PATH"),
-            "lastStatus": lastStatus,
-            "lastMessage": lastMessage,
-            "lastUpdated": lastUpdated,
-        }
-        return jsonify(data), 200
-    except Exception as e:
-        return safeJsonifyError(e, 500, "health")
 
+def findStoryGraphFragmentUrls(soup, baseUrl: str, listUrl: str) -> list[tuple[str, str | None]]:
+    candidates = [(urljoin(baseUrl, frame.get("src")), frame.get("id")) for frame in soup.select("turbo-frame[src]:not([complete])")]
+    for link in soup.select('a[rel="next"][href], a.next_page[href]'):
+        candidates.append((urljoin(baseUrl, link.get("href")), None))
+    return [(fragmentUrl, frameId) for fragmentUrl, frameId in candidates if isStoryGraphListFragmentUrl(fragmentUrl, listUrl)]
 
-@app.route("/api/scraper/get_books", methods=["GET"])
-def scraper_get_books():
-    try:
-        global currentBook, currentIsbn, books
 
-        with booksLock:
-            scraped = getBooksCached()
-            books = scraped or {}
+def fetchStoryGraphBooksWithHttp(url: str, rememberUserToken: str, maxFragments: int = 25) -> tuple[list[dict], bool]:
+    from bs4 import BeautifulSoup, SoupStrainer
 
-            if not books:
-                updateStatus("Error", "No books found.")
-                return jsonify({"error": "No books found."}), 404
+    cookies = {}
+    if rememberUserToken and rememberUserToken != "PASTE_VALUE_HERE":
+        cookies["remember_user_token"] = rememberUserToken
 
-            if currentIsbn and currentIsbn in books:
-                currentBook = books[currentIsbn]
-            else:
-                currentBook = next(iter(books.values()))
-                currentIsbn = currentBook["isbn"]
-                with configLock:
-                    CONFIG["current_isbn"] = currentIsbn
-                save_config_internal()
+    headers = {"User-Agent": STORYGRAPH_USER_AGENT, "Accept": "text/html"}
+    pendingUrls = [(url, None)]
+    seenUrls = set()
+    seenBookKeys = set()
+    collectedBooks = []
 
-            init_event.set()
-            updateStatus("Active", f"Books ready (current: {currentIsbn})")
-            return jsonify([books, currentIsbn]), 200
+    try:
+        while pendingUrls and len(seenUrls) < maxFragments:
+            fragmentUrl, frameId = pendingUrls.pop(0)
+            if fragmentUrl in seenUrls:
+                continue
+            seenUrls.add(fragmentUrl)
 
-    except Exception as e:
-        return safeJsonifyError(e, 500, "scraper_get_books")
+            requestHeaders = dict(headers)
+            if frameId:
+                requestHeaders["Turbo-Frame"] = frameId
+
+            fetchStartedAt = time.perf_counter()
+            try:
+                response = getHttpSession().get(fragmentUrl, headers=requestHeaders, cookies=cookies, timeout=10)
+            except Exception:
+                metrics.inc("grrpc_storygraph_http_fetches_total", result="error")
+                raise
+            metrics.observe("grrpc_storygraph_http_fetch_seconds", time.perf_counter() - fetchStartedAt)
+            metrics.inc("grrpc_storygraph_http_fetches_total", result=str(response.status_code))
+            if isStoryGraphSignInUrl(response.url) or any(isStoryGraphSignInUrl(r.headers.get("Location")) for r in response.history):
+                return [], True
+            if response.status_code != 200:
+                raise RuntimeError(f"{response.status_code} {response.reason} for {fragmentUrl}")
+
+            with metrics.timer("grrpc_parse_seconds", platform="storygraph"):
+                fragmentBooks = parseStoryGraphCurrentReadsHtml(response.text)
+                linkSoup = BeautifulSoup(response.text, "html.parser", parse_only=SoupStrainer(["turbo-frame", "a"]))
+            for book in fragmentBooks:
+                bookKey = chooseStableBookKey(book)
+                if bookKey in seenBookKeys:
+                    continue
+                seenBookKeys.add(bookKey)
+                collectedBooks.append(book)
+
+            for nextUrl in findStoryGraphFragmentUrls(linkSoup, response.url, url):
+                if nextUrl[0] not in seenUrls:
+                    pendingUrls.append(nextUrl)
+    finally:
+        try:
+            getHttpSession().cookies.clear(domain="app.thestorygraph.com")
+        except KeyError:
+            pass
+
+    return collectedBooks, False
+
+
+def recordStoryGraphFetchPath(fetchPath: str, fellBack: bool) -> None:
+    with storygraphFetchStatsLock:
+        storygraphFetchStats["lastFetchPath"] = fetchPath
+        if fetchPath == "http":
+            storygraphFetchStats["httpFastPathHits"] += 1
+        else:
+            storygraphFetchStats["browserFetches"] += 1
+        if fellBack:
+            storygraphFetchStats["browserFallbacks"] += 1
+
+
+HTML_PARSER_PREFERENCE = ("lxml", "html.parser")
+
+htmlParserBackend = None
+goodreadsTableStrainer = None
+
+
+def getGoodreadsTableStrainer():
+    global goodreadsTableStrainer
+    if goodreadsTableStrainer is None:
+        from bs4 import SoupStrainer
+
+        goodreadsTableStrainer = SoupStrainer("table", id="books")
+    return goodreadsTableStrainer
+
+
+def getHtmlParserBackend() -> str:
+    global htmlParserBackend
+    if htmlParserBackend is None:
+        for candidate in HTML_PARSER_PREFERENCE:
+            if candidate == "html.parser":
+                htmlParserBackend = candidate
+                break
+            try:
+                __import__(candidate)
+            except ImportError:
+                continue
+            htmlParserBackend = candidate
+            break
+        logInfo(f"Using {htmlParserBackend} for HTML parsing.", uiStatus=None)
+    return htmlParserBackend
+
+
+def findGoodreadsReviewRows(htmlText: str, parserBackend: str | None = None) -> list | None:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(htmlText, parserBackend or getHtmlParserBackend(), parse_only=getGoodreadsTableStrainer())
+    bookTable = soup.find("table", id="books")
+    if not bookTable:
+        return None
+    return bookTable.select('tr[id^="review_"]')
+
+
+def parseGoodreadsRow(row, bookUrl: str) -> dict:
+    cells = {}
+    for cell in row.find_all("td", recursive=False):
+        cells.setdefault(" ".join(cell.get("class") or []), cell)
+
+    titleCell = cells.get("field title")
+    authorCell = cells.get("field author")
+    coverCell = cells.get("field cover")
+    dateCell = cells.get("field date_started")
+    isbnCell = cells.get("field isbn")
+
+    title = safeText(titleCell.find("a") if titleCell else None) or "Unknown Title"
+    author = safeText(authorCell.find("a") if authorCell else None) or "Unknown Author"
+
+    coverImg = coverCell.find("img") if coverCell else None
+    coverArt = sanitizeCover(coverImg["src"] if coverImg else None)
+
+    startSpan = dateCell.find("span", class_="date_started_value") if dateCell else None
+    startDate = safeText(startSpan)
+
+    isbnVal = None
+    if isbnCell:
+        txt = safeText(isbnCell.find("div", class_="value"))
+        if txt:
+            isbnVal = txt
+
+    isbn = isbnVal if isbnVal else f"noisbn-{title}-{author}"
+
+    return {
+        "isbn": isbn,
+        "title": title,
+        "author": author,
+        "coverArt": coverArt,
+        "startDate": startDate,
+        "platform": "goodreads",
+        "bookUrl": bookUrl,
+    }
+
+
+scrapeValidatorsLock = threading.Lock()
+scrapeValidators = {}
+scrapeValidatorStats = {"notModified": 0, "bodyHashHits": 0, "fullParses": 0, "rowSplitFallbacks": 0}
+
+
+def getScrapeValidator(validatorKey: tuple) -> dict:
+    with scrapeValidatorsLock:
+        return dict(scrapeValidators.get(validatorKey) or {})
+
+
+def getConditionalRequestHeaders(validatorKey: tuple) -> dict:
+    validator = getScrapeValidator(validatorKey)
+    if not validator.get("books"):
+        return {}
+
+    headers = {}
+    if validator.get("etag"):
+        headers["If-None-Match"] = validator["etag"]
+    if validator.get("lastModified"):
+        headers["If-Modified-Since"] = validator["lastModified"]
+    return headers
+
+
+def getUnchangedScrapeResult(validatorKey: tuple, statKey: str) -> dict | None:
+    with scrapeValidatorsLock:
+        previousBooks = (scrapeValidators.get(validatorKey) or {}).get("books")
+        if previousBooks is not None:
+            scrapeValidatorStats[statKey] += 1
+    return previousBooks
+
+
+def rememberScrapeValidator(validatorKey: tuple, response, bodyHash: str, scrapedBooks: dict) -> None:
+    with scrapeValidatorsLock:
+        scrapeValidators[validatorKey] = {
+            "etag": response.headers.get("ETag"),
+            "lastModified": response.headers.get("Last-Modified"),
+            "bodyHash": bodyHash,
+            "books": scrapedBooks,
+        }
+
+
+def forgetScrapeValidator(validatorKey: tuple) -> None:
+    with scrapeValidatorsLock:
+        scrapeValidators.pop(validatorKey, None)
+
+
+def getScrapeValidatorStats() -> dict:
+    with scrapeValidatorsLock:
+        data = dict(scrapeValidatorStats)
+        data.update(goodreadsPageStats)
+    return data
+
+
+GOODREADS_BOOKS_TABLE_RE = re.compile(r"<table\b[^>]*\bid=[\"']books[\"'][^>]*>", re.IGNORECASE)
+GOODREADS_ROW_RE = re.compile(r"<tr\b[^>]*\bid=[\"'](review_[^\"']+)[\"'][^>]*>.*?</tr>", re.IGNORECASE | re.DOTALL)
+
+
+def splitGoodreadsRowChunks(htmlText: str) -> list[tuple[str, str]] | None:
+    tableMatch = GOODREADS_BOOKS_TABLE_RE.search(htmlText)
+    if not tableMatch:
+        return None
+
+    tableEnd = htmlText.find("</table>", tableMatch.end())
+    if tableEnd < 0:
+        return None
+
+    tableBody = htmlText[tableMatch.end():tableEnd]
+    rowChunks = None
+    if "<table" not in tableBody.lower() and "<!--" not in tableBody:
+        rowChunks = [(rowMatch.group(1), rowMatch.group(0)) for rowMatch in GOODREADS_ROW_RE.finditer(tableBody)]
+        if len(rowChunks) != tableBody.count('id="review_') + tableBody.count("id='review_"):
+            rowChunks = None
+
+    if rowChunks is None:
+        with scrapeValidatorsLock:
+            scrapeValidatorStats["rowSplitFallbacks"] += 1
+    return rowChunks
+
+
+def parseGoodreadsRowsSafely(rows: list, bookUrl: str) -> list[tuple]:
+    parsed = []
+    for row in rows:
+        try:
+            parsed.append((row.get("id"), parseGoodreadsRow(row, bookUrl)))
+        except Exception as rowErr:
+            logWarning(f"Failed to parse a Goodreads row: {rowErr}")
+    return parsed
+
+
+def parseGoodreadsShelf(htmlText: str, bookUrl: str) -> tuple[int | None, list[dict]]:
+    rowChunks = splitGoodreadsRowChunks(htmlText)
+    if rowChunks is None:
+        rows = findGoodreadsReviewRows(htmlText)
+        if rows is None:
+            return None, []
+        return len(rows), [book for _, book in parseGoodreadsRowsSafely(rows, bookUrl)]
+
+    memoKeys = [(rowId, getRowMarkupHash(bookUrl + rowMarkup)) for rowId, rowMarkup in rowChunks]
+    booksByKey = {}
+    missedChunks = []
+    for memoKey, (rowId, rowMarkup) in zip(memoKeys, rowChunks):
+        book = goodreadsRowMemo.get(memoKey)
+        if book is None:
+            missedChunks.append((memoKey, rowMarkup))
+        else:
+            booksByKey[memoKey] = book
+
+    if missedChunks:
+        from bs4 import BeautifulSoup
+
+        missedHtml = "<table><tbody>" + "".join(rowMarkup for _, rowMarkup in missedChunks) + "</tbody></table>"
+        missedSoup = BeautifulSoup(missedHtml, getHtmlParserBackend())
+        missedRows = missedSoup.select('tr[id^="review_"]')
+        missedKeysById = {memoKey[0]: memoKey for memoKey, _ in missedChunks}
+        for rowId, book in parseGoodreadsRowsSafely(missedRows, bookUrl):
+            memoKey = missedKeysById.get(rowId)
+            if memoKey is None:
+                continue
+            goodreadsRowMemo.put(memoKey, book)
+            booksByKey[memoKey] = book
+
+    return len(rowChunks), [booksByKey[memoKey] for memoKey in memoKeys if memoKey in booksByKey]
+
+
+GOODREADS_PER_PAGE = 100
+GOODREADS_MAX_PAGES = 20
+GOODREADS_PAGE_WORKERS = 4
+GOODREADS_PAGE_TIMEOUT_SECONDS = 10
+GOODREADS_PAGES_DEADLINE_SECONDS = 25
+GOODREADS_PAGE_PARAM_RE = re.compile(r"[?&](?:amp;)?page=(\d+)")
+
+goodreadsPageStats = {"extraPages": 0, "pageFailures": 0, "pageTimeouts": 0, "lastPageCount": None}
+
+
+def getGoodreadsShelfPageUrl(goodreadsId: str, page: int) -> str:
+    url = f"https://www.goodreads.com/review/list/{goodreadsId}?shelf=currently-reading&per_page={GOODREADS_PER_PAGE}"
+    return url if page <= 1 else f"{url}&page={page}"
+
+
+def findGoodreadsLastPage(htmlText: str) -> int:
+    tableStart = max(htmlText.find('id="books"'), 0)
+    tableEnd = max(htmlText.find("</table>", tableStart), tableStart)
+
+    for marker in ('id="reviewPagination"', "id='reviewPagination'"):
+        paginationStart = htmlText.find(marker, tableEnd)
+        if paginationStart >= 0:
+            break
+    else:
+        return 1
+
+    paginationEnd = htmlText.find("</div>", paginationStart)
+    paginationHtml = htmlText[paginationStart:paginationEnd if paginationEnd >= 0 else None]
+    pages = [int(pageText) for pageText in GOODREADS_PAGE_PARAM_RE.findall(paginationHtml)]
+    return max(pages, default=1)
+
+
+def fetchGoodreadsShelfPage(goodreadsId: str, page: int, bookUrl: str, parentSpan=None) -> list[dict]:
+    with traceSpan("goodreads.fetch_page", parent=parentSpan, page=page) as span:
+        fetchStartedAt = time.perf_counter()
+        try:
+            response = getHttpSession().get(
+                getGoodreadsShelfPageUrl(goodreadsId, page),
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=GOODREADS_PAGE_TIMEOUT_SECONDS,
+            )
+        except Exception:
+            metrics.inc("grrpc_goodreads_fetches_total", page="extra", result="error")
+            raise
+        metrics.observe("grrpc_goodreads_fetch_seconds", time.perf_counter() - fetchStartedAt, page="extra")
+        metrics.inc("grrpc_goodreads_fetches_total", page="extra", result=str(response.status_code))
+        if response.status_code != 200:
+            raise ValueError(f"{response.status_code} {response.reason}")
+
+        with metrics.timer("grrpc_parse_seconds", platform="goodreads"):
+            rowCount, parsedBooks = parseGoodreadsShelf(response.text, bookUrl)
+        if rowCount is None:
+            raise ValueError("no books table found")
+        span.set(books=len(parsedBooks))
+        return parsedBooks
+
+
+def fetchGoodreadsRemainingPages(goodreadsId: str, lastPage: int, bookUrl: str) -> tuple[dict, bool]:
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    if lastPage > GOODREADS_MAX_PAGES:
+        logWarning(f"Goodreads shelf has {lastPage} pages; only fetching the first {GOODREADS_MAX_PAGES}.")
+
+    pages = list(range(2, min(lastPage, GOODREADS_MAX_PAGES) + 1))
+    executor = ThreadPoolExecutor(max_workers=min(GOODREADS_PAGE_WORKERS, len(pages)), thread_name_prefix="GoodreadsPage")
+    try:
+        parentSpan = getCurrentSpan()
+        futures = {executor.submit(fetchGoodreadsShelfPage, goodreadsId, page, bookUrl, parentSpan): page for page in pages}
+        done, notDone = wait(futures, timeout=GOODREADS_PAGES_DEADLINE_SECONDS)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    pageBooks = {}
+    complete = not notDone
+    for future in done:
+        page = futures[future]
+        try:
+            pageBooks[page] = future.result()
+        except Exception as pageErr:
+            complete = False
+            with scrapeValidatorsLock:
+                goodreadsPageStats["pageFailures"] += 1
+            logWarning(f"Goodreads page {page} failed; merging without it: {pageErr}")
+
+    for future in notDone:
+        with scrapeValidatorsLock:
+            goodreadsPageStats["pageTimeouts"] += 1
+        logWarning(f"Goodreads page {futures[future]} timed out; merging without it.")
+
+    with scrapeValidatorsLock:
+        goodreadsPageStats["extraPages"] += len(pageBooks)
+    return pageBooks, complete
+
+
+def get_books() -> dict | None:
+    cfg = getPlatformConfigSnapshot()
+    with traceSpan("get_books", platform=cfg["platform"]) as span:
+        found = fetchBooksForPlatform(cfg)
+        span.set(books=len(found) if found else 0)
+        return found
+
+
+def fetchBooksForPlatform(cfg: dict) -> dict | None:
+    platform = cfg["platform"]
+
+    if platform == "goodreads":
+        goodreadsId = cfg["goodreads_id"]
+        if not goodreadsId:
+            logWarning("Goodreads ID missing.", uiStatus="Error")
+            return None
+
+        url = f"https://www.goodreads.com/review/list/{goodreadsId}?shelf=currently-reading"
+        headers = {"User-Agent": "Mozilla/5.0"}
+
+        logInfo(f"Fetching Goodreads currently-reading for user {goodreadsId}.", uiStatus="Info")
+
+        validatorKey = ("goodreads", goodreadsId)
+        headers.update(getConditionalRequestHeaders(validatorKey))
+
+        with traceSpan("goodreads.fetch_page", page=1) as span:
+            fetchStartedAt = time.perf_counter()
+            try:
+                response = getHttpSession().get(getGoodreadsShelfPageUrl(goodreadsId, 1), headers=headers, timeout=GOODREADS_PAGE_TIMEOUT_SECONDS)
+            except Exception as e:
+                metrics.inc("grrpc_goodreads_fetches_total", page="first", result="error")
+                logError(f"Goodreads request failed: {e}", uiStatus="Error", exc=e)
+                return None
+            metrics.observe("grrpc_goodreads_fetch_seconds", time.perf_counter() - fetchStartedAt, page="first")
+            metrics.inc("grrpc_goodreads_fetches_total", page="first", result=str(response.status_code))
+            span.set(status=response.status_code)
+
+        if response.status_code == 304:
+            previousBooks = getUnchangedScrapeResult(validatorKey, "notModified")
+            if previousBooks is not None:
+                logInfo(f"Goodreads shelf not modified (304); reusing {len(previousBooks)} book(s).", uiStatus="Active")
+                return previousBooks
+
+        if response.status_code != 200:
+            logError(f"Goodreads fetch failed: {response.status_code} {response.reason}", uiStatus="Error")
+            return None
+
+        bodyHash = hashlib.sha256(response.content).hexdigest()
+        if getScrapeValidator(validatorKey).get("bodyHash") == bodyHash:
+            previousBooks = getUnchangedScrapeResult(validatorKey, "bodyHashHits")
+            if previousBooks is not None:
+                rememberScrapeValidator(validatorKey, response, bodyHash, previousBooks)
+                logInfo(f"Goodreads shelf unchanged; reusing {len(previousBooks)} book(s).", uiStatus="Active")
+                return previousBooks
+
+        with traceSpan("goodreads.parse", page=1), metrics.timer("grrpc_parse_seconds", platform="goodreads"):
+            rowCount, parsedBooks = parseGoodreadsShelf(response.text, url)
+        if rowCount is None:
+            logError("Goodreads page parsed but no books table found.", uiStatus="Error")
+            return None
+
+        if not rowCount:
+            logWarning("Goodreads books table found but no review rows.", uiStatus="Error")
+            return None
+
+        lastPage = findGoodreadsLastPage(response.text)
+        with scrapeValidatorsLock:
+            goodreadsPageStats["lastPageCount"] = lastPage
+
+        pageBooks = {1: parsedBooks}
+        complete = True
+        if lastPage > 1:
+            logInfo(f"Goodreads shelf has {lastPage} pages; fetching the rest in parallel.", uiStatus="Info")
+            with traceSpan("goodreads.fetch_remaining_pages", pages=lastPage - 1) as span:
+                remainingPages, complete = fetchGoodreadsRemainingPages(goodreadsId, lastPage, url)
+                span.set(fetched=len(remainingPages), complete=complete)
+            pageBooks.update(remainingPages)
+
+        found = {}
+        for page in sorted(pageBooks):
+            for book in pageBooks[page]:
+                found.setdefault(book["isbn"], book)
+
+        if not found:
+            logWarning("Goodreads parse succeeded but produced 0 books.", uiStatus="Error")
+            return None
+
+        # A 304 or unchanged body on page 1 says nothing about later pages, so only
+        # single-page shelves keep validators.
+        if lastPage == 1:
+            rememberScrapeValidator(validatorKey, response, bodyHash, found)
+        else:
+            forgetScrapeValidator(validatorKey)
+            if not complete:
+                logWarning("Goodreads shelf is incomplete; merged without the missing pages.")
+        with scrapeValidatorsLock:
+            scrapeValidatorStats["fullParses"] += 1
+
+        logInfo(f"Fetched {len(found)} book(s) from Goodreads.", uiStatus="Active")
+        return found
+
+    if platform == "storygraph":
+        storygraphUsername = cfg["storygraph_username"]
+        if not storygraphUsername:
+            logWarning("StoryGraph username missing.", uiStatus="Error")
+            return None
+
+        url = f"https://app.thestorygraph.com/currently-reading/{storygraphUsername}"
+
+        with configLock:
+            rememberUserToken = (CONFIG.get("storygraph_remember_user_token") or "").strip()
+
+        logInfo(f"Fetching StoryGraph currently-reading for user {storygraphUsername}.", uiStatus="Info")
+
+        fetchMode = cfg["storygraph_fetch_mode"]
+        storygraphList = []
+        fellBack = False
+
+        if fetchMode in ("auto", "http"):
+            with traceSpan("storygraph.http_fetch") as span:
+                try:
+                    storygraphList, signInRequired = fetchStoryGraphBooksWithHttp(url, rememberUserToken)
+                except Exception as e:
+                    logWarning(f"StoryGraph HTTP fetch failed: {e}", uiStatus=None)
+                    storygraphList, signInRequired = [], False
+                span.set(books=len(storygraphList), signInRequired=signInRequired)
+
+            if not storygraphList:
+                reason = "redirected to sign-in" if signInRequired else "found 0 books"
+                if fetchMode == "http":
+                    logWarning(f"StoryGraph HTTP fetch {reason}; browser fallback disabled.", uiStatus="Error")
+                    return None
+                logInfo(f"StoryGraph HTTP fast path {reason}; falling back to browser.", uiStatus="Info")
+                fellBack = True
+
+        if storygraphList:
+            fetchPath = "http"
+        else:
+            fetchPath = "browser"
+
+            try:
+                idleSeconds = int(cfg.get("storygraph_browser_idle_seconds", 300))
+            except Exception:
+                idleSeconds = 300
+
+            with traceSpan("storygraph.browser_fetch", fellBack=fellBack):
+                try:
+                    htmlText, signInRequired = fetchStoryGraphHtmlWithBrowser(url, rememberUserToken, idleSeconds)
+                except ImportError as e:
+                    logError(f"Playwright import failed: {e}", uiStatus="Error", exc=e)
+                    return None
+                except Exception as e:
+                    logError(f"StoryGraph Playwright fetch failed: {e}", uiStatus="Error", exc=e)
+                    return None
+
+            if signInRequired:
+                logWarning(
+                    "StoryGraph requires login or list is private. Add remember_user_token or make profile public.",
+                    uiStatus="Error",
+                )
+                return None
+
+            if not htmlText:
+                logWarning("StoryGraph fetch returned empty HTML.", uiStatus="Error")
+                return None
+
+            with traceSpan("storygraph.parse") as span, metrics.timer("grrpc_parse_seconds", platform="storygraph"):
+                storygraphList = parseStoryGraphCurrentReadsHtml(htmlText)
+                span.set(books=len(storygraphList))
+            if not storygraphList:
+                logWarning("StoryGraph parsed 0 books.", uiStatus="Error")
+                return None
+
+        recordStoryGraphFetchPath(fetchPath, fellBack)
+
+        with traceSpan("storygraph.normalize"), metrics.timer("grrpc_normalize_seconds", platform="storygraph"):
+            normalizedDict = normalizeStorygraphBooksToDict(storygraphList)
+        if not normalizedDict:
+            logWarning("StoryGraph normalize produced 0 books.", uiStatus="Error")
+            return None
+
+        logInfo(f"Fetched {len(normalizedDict)} book(s) from StoryGraph via {fetchPath}.", uiStatus="Active")
+        return normalizedDict
+
+    logError(f"Unknown platform: {platform}", uiStatus="Error")
+    return None
+
+
+scrapeFlightsLock = threading.Lock()
+scrapeFlights = {}
+scrapeFlightStats = {"leaders": 0, "coalesced": 0}
+
+
+def getAuthFingerprint(platform: str) -> str:
+    if platform != "storygraph":
+        return ""
+    with configLock:
+        rememberUserToken = (CONFIG.get("storygraph_remember_user_token") or "").strip()
+    if not rememberUserToken:
+        return ""
+    return hashlib.sha256(rememberUserToken.encode("utf-8")).hexdigest()[:16]
+
+
+def getScrapeKey(cfg: dict) -> tuple:
+    platform = cfg["platform"]
+    userId = cfg["storygraph_username"] if platform == "storygraph" else cfg["goodreads_id"]
+    return (platform, userId, getAuthFingerprint(platform))
+
+
+def scrapeBooksSingleFlight(scrapeKey: tuple) -> dict | None:
+    with scrapeFlightsLock:
+        flight = scrapeFlights.get(scrapeKey)
+        isLeader = flight is None
+        if isLeader:
+            flight = {"done": threading.Event(), "result": None, "error": None, "waiters": 0}
+            scrapeFlights[scrapeKey] = flight
+            scrapeFlightStats["leaders"] += 1
+        else:
+            flight["waiters"] += 1
+            scrapeFlightStats["coalesced"] += 1
+
+    if not isLeader:
+        logInfo(f"Joining in-flight scrape for {scrapeKey[0]}.", uiStatus=None)
+        flight["done"].wait()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return flight["result"]
+
+    try:
+        flight["result"] = get_books()
+    except Exception as e:
+        flight["error"] = e
+        raise
+    finally:
+        with scrapeFlightsLock:
+            scrapeFlights.pop(scrapeKey, None)
+        flight["done"].set()
+
+    return flight["result"]
+
+
+def getScrapeFlightStats() -> dict:
+    with scrapeFlightsLock:
+        data = dict(scrapeFlightStats)
+        data["inFlight"] = len(scrapeFlights)
+    return data
+
+
+BOOKS_DISK_CACHE_VERSION = 2
+BOOKS_DISK_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+BOOKS_DISK_CACHE_RESAVE_SECONDS = 60 * 60
+
+booksDiskCachePath = os.path.join(cacheDir, "books_cache.json")
+booksDiskCacheLock = threading.Lock()
+booksDiskCacheEntries = {}
+
+
+def getBooksDiskCacheKey(scrapeKey: tuple) -> str:
+    return ":".join(scrapeKey)
+
+
+def loadBooksDiskCache() -> dict:
+    try:
+        if not os.path.exists(booksDiskCachePath):
+            return {}
+
+        if time.time() - os.path.getmtime(booksDiskCachePath) > BOOKS_DISK_CACHE_MAX_AGE_SECONDS:
+            logInfo("Books disk cache expired; ignoring it.", uiStatus=None)
+            return {}
+
+        with open(booksDiskCachePath, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        if not isinstance(payload, dict) or payload.get("version") != BOOKS_DISK_CACHE_VERSION:
+            logInfo("Books disk cache has an incompatible schema version; ignoring it.", uiStatus=None)
+            return {}
+
+        now = time.time()
+        entries = {}
+        for cacheKey, entry in (payload.get("entries") or {}).items():
+            if not isinstance(entry, dict) or not isinstance(entry.get("books"), dict) or not entry["books"]:
+                continue
+            entryKey = entry.get("key")
+            if not isinstance(entryKey, list) or len(entryKey) != 3 or getBooksDiskCacheKey(tuple(entryKey)) != cacheKey:
+                continue
+            if now - float(entry.get("savedAt") or 0) > BOOKS_DISK_CACHE_MAX_AGE_SECONDS:
+                continue
+            entries[cacheKey] = entry
+        return entries
+    except Exception as e:
+        logWarning(f"Failed to load books disk cache; ignoring it: {e}")
+        return {}
+
+
+def saveBooksDiskCacheEntry(scrapeKey: tuple, scraped: dict) -> None:
+    cacheKey = getBooksDiskCacheKey(scrapeKey)
+    now = time.time()
+
+    try:
+        with booksDiskCacheLock:
+            previous = booksDiskCacheEntries.get(cacheKey)
+            if (
+                previous
+                and previous["books"] == scraped
+                and (now - float(previous.get("savedAt") or 0)) < BOOKS_DISK_CACHE_RESAVE_SECONDS
+            ):
+                return
+
+            booksDiskCacheEntries[cacheKey] = {"key": list(scrapeKey), "savedAt": now, "books": scraped}
+            for staleKey in sorted(booksDiskCacheEntries, key=lambda k: float(booksDiskCacheEntries[k].get("savedAt") or 0))[:-BOOKS_CACHE_MAX_ENTRIES]:
+                del booksDiskCacheEntries[staleKey]
+            payload = {"version": BOOKS_DISK_CACHE_VERSION, "entries": booksDiskCacheEntries}
+
+            tmpPath = booksDiskCachePath + ".tmp"
+            with open(tmpPath, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmpPath, booksDiskCachePath)
+    except Exception as e:
+        logWarning(f"Failed to save books disk cache: {e}")
+
+
+class BooksCache:
+    def __init__(self, capacity: int = BOOKS_CACHE_MAX_ENTRIES):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "staleHits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def getEntryLocked(self, key: tuple) -> dict:
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {"data": None, "storedAt": 0, "expiresAt": 0, "refreshing": False, "failedAt": 0, "lastError": None}
+            self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return entry
+
+    def lookup(self, key: tuple, now: float) -> tuple[dict | None, bool, bool]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry["data"] is None:
+                self.stats["misses"] += 1
+                refreshAllowed = entry is None or (not entry["refreshing"] and (now - entry["failedAt"]) >= BOOKS_REFRESH_RETRY_SECONDS)
+                return None, False, refreshAllowed
+
+            self.entries.move_to_end(key)
+            fresh = now < entry["expiresAt"]
+            self.stats["hits" if fresh else "staleHits"] += 1
+            refreshAllowed = not entry["refreshing"] and (now - entry["failedAt"]) >= BOOKS_REFRESH_RETRY_SECONDS
+            return entry["data"], fresh, refreshAllowed
+
+    def store(self, key: tuple, data: dict, storedAt: float, ttlSeconds: float) -> None:
+        with self.lock:
+            entry = self.getEntryLocked(key)
+            entry["data"] = data
+            entry["storedAt"] = storedAt
+            entry["expiresAt"] = storedAt + ttlSeconds
+            entry["failedAt"] = 0
+            entry["lastError"] = None
+
+    def recordFailure(self, key: tuple, error: str) -> None:
+        with self.lock:
+            entry = self.getEntryLocked(key)
+            entry["failedAt"] = time.time()
+            entry["lastError"] = error
+
+    def beginRefresh(self, key: tuple) -> bool:
+        with self.lock:
+            entry = self.getEntryLocked(key)
+            if entry["refreshing"]:
+                return False
+            entry["refreshing"] = True
+            return True
+
+    def endRefresh(self, key: tuple) -> None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["refreshing"] = False
+
+    def invalidate(self, predicate=None) -> int:
+        with self.lock:
+            keys = [key for key in self.entries if predicate is None or predicate(key)]
+            for key in keys:
+                del self.entries[key]
+            self.stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def getStats(self) -> dict:
+        now = time.time()
+        with self.lock:
+            data = dict(self.stats)
+            data["size"] = len(self.entries)
+            data["capacity"] = self.capacity
+            data["entries"] = [
+                {
+                    "platform": key[0],
+                    "userId": key[1],
+                    "authenticated": bool(key[2]),
+                    "ageSeconds": round(now - entry["storedAt"], 1) if entry["data"] is not None else None,
+                    "expiresInSeconds": round(entry["expiresAt"] - now, 1) if entry["data"] is not None else None,
+                    "refreshing": entry["refreshing"],
+                    "lastError": entry["lastError"],
+                }
+                for key, entry in self.entries.items()
+            ]
+        return data
+
+
+booksCacheStore = BooksCache()
+
+
+def storeBooksCacheResult(scrapeKey: tuple, scraped: dict | None, startedAt: float, ttlSeconds: float, error: str | None = None) -> None:
+    if not scraped:
+        booksCacheStore.recordFailure(scrapeKey, error or "Scrape returned no books.")
+        return
+
+    booksCacheStore.store(scrapeKey, scraped, startedAt, ttlSeconds)
+    saveBooksDiskCacheEntry(scrapeKey, scraped)
+
+
+def refreshBooksCacheInBackground(scrapeKey: tuple, ttlSeconds: float) -> None:
+    platform = scrapeKey[0]
+
+    def refreshWorker():
+        startedAt = time.time()
+        scraped = None
+        error = None
+        try:
+            scraped = scrapeBooksSingleFlight(scrapeKey)
+            if getScrapeKey(getPlatformConfigSnapshot()) != scrapeKey:
+                scraped = None
+                error = "Account settings changed during refresh."
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logError(f"Background books refresh failed: {e}", uiStatus="Error", exc=e)
+        finally:
+            storeBooksCacheResult(scrapeKey, scraped, startedAt, ttlSeconds, error)
+            booksCacheStore.endRefresh(scrapeKey)
+
+        if scraped:
+            publishEvent("booksRefreshed", {"platform": platform, "count": len(scraped)})
+            logInfo(f"Background books refresh finished ({len(scraped)} book(s)).", uiStatus=None)
+        else:
+            logWarning("Background books refresh failed; keeping last good books.", uiStatus="Info")
+
+    if not booksCacheStore.beginRefresh(scrapeKey):
+        return
+
+    threading.Thread(target=refreshWorker, daemon=True, name="BooksRefreshThread").start()
+
+
+def getBooksCachedWithState(ttlSeconds: int = BOOKS_CACHE_TTL_SECONDS) -> tuple[dict | None, bool]:
+    cfg = getPlatformConfigSnapshot()
+    scrapeKey = getScrapeKey(cfg)
+    now = time.time()
+
+    with traceSpan("getBooksCached", platform=scrapeKey[0]) as span:
+        cached, fresh, refreshAllowed = booksCacheStore.lookup(scrapeKey, now)
+        if cached is not None and fresh:
+            metrics.inc("grrpc_books_cache_requests_total", result="hit")
+            span.set(result="hit")
+            return cached, False
+
+        if cached is not None and cfg["books_stale_while_revalidate"]:
+            metrics.inc("grrpc_books_cache_requests_total", result="stale")
+            span.set(result="stale", refreshStarted=refreshAllowed)
+            if refreshAllowed:
+                refreshBooksCacheInBackground(scrapeKey, ttlSeconds)
+            return cached, True
+
+        metrics.inc("grrpc_books_cache_requests_total", result="miss")
+        span.set(result="miss")
+        scraped = scrapeBooksSingleFlight(scrapeKey)
+        storeBooksCacheResult(scrapeKey, scraped, now, ttlSeconds)
+        if not scraped and cached is not None:
+            span.set(servedStale=True)
+            return cached, True
+        return scraped, False
+
+
+def getBooksCached(ttlSeconds: int = BOOKS_CACHE_TTL_SECONDS) -> dict | None:
+    scraped, _ = getBooksCachedWithState(ttlSeconds)
+    return scraped
+
+
+def invalidateBooksCache(platform: str | None = None, userId: str | None = None) -> int:
+    if platform is None:
+        return booksCacheStore.invalidate()
+    return booksCacheStore.invalidate(lambda key: key[0] == platform and (userId is None or key[1] == userId))
+
+
+def getBooksCacheStats() -> dict:
+    data = booksCacheStore.getStats()
+    with booksDiskCacheLock:
+        data["diskEntries"] = len(booksDiskCacheEntries)
+    return data
+
+
+def seedBooksCacheFromDisk() -> None:
+    entries = loadBooksDiskCache()
+    with booksDiskCacheLock:
+        booksDiskCacheEntries.update(entries)
+
+    cfg = getPlatformConfigSnapshot()
+    currentCacheKey = getBooksDiskCacheKey(getScrapeKey(cfg))
+
+    seedOrder = sorted(entries, key=lambda cacheKey: (cacheKey == currentCacheKey, float(entries[cacheKey].get("savedAt") or 0)))
+    for cacheKey in seedOrder[-BOOKS_CACHE_MAX_ENTRIES:]:
+        entry = entries[cacheKey]
+        booksCacheStore.store(tuple(entry["key"]), entry["books"], float(entry.get("savedAt") or 0), BOOKS_CACHE_TTL_SECONDS)
+
+    entry = entries.get(currentCacheKey)
+    if not entry:
+        return
+
+    with configLock:
+        configIsbn = CONFIG.get("current_isbn")
+    swapBookSnapshot(lambda previous: (entry["books"], configIsbn))
+
+    logInfo(f"Loaded {len(entry['books'])} cached {cfg['platform']} book(s) from disk.", uiStatus="Info")
+
+
+COVER_CACHE_DIR = os.path.join(cacheDir, "covers")
+COVER_INDEX_VERSION = 1
+COVER_MAX_FETCH_BYTES = 5 * 1024 * 1024
+COVER_MAX_REDIRECTS = 3
+COVER_CACHE_MAX_AGE_SECONDS = 365 * 24 * 60 * 60
+COVER_THUMBNAIL_WIDTHS = (64, 160, 320)
+COVER_ALLOWED_HOST_SUFFIXES = ("gr-assets.com", "goodreads.com", "thestorygraph.com", "media-amazon.com", "ssl-images-amazon.com")
+COVER_FILE_EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp", "image/gif": "gif"}
+
+coverCacheLock = threading.Lock()
+coverIndex = {}
+coverIndexLoaded = False
+coverCacheStats = {"hits": 0, "misses": 0, "fetchFailures": 0, "evictions": 0, "thumbnailsBuilt": 0, "bytes": None}
+
+
+def getCoverIndexPath() -> str:
+    return os.path.join(COVER_CACHE_DIR, "index.json")
+
+
+def loadCoverIndexLocked() -> None:
+    global coverIndexLoaded
+
+    if coverIndexLoaded:
+        return
+    coverIndexLoaded = True
+    os.makedirs(COVER_CACHE_DIR, exist_ok=True)
+
+    try:
+        with open(getCoverIndexPath(), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if isinstance(payload, dict) and payload.get("version") == COVER_INDEX_VERSION:
+            coverIndex.update(payload.get("entries") or {})
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logWarning(f"Failed to load cover index; starting empty: {e}")
+
+
+def saveCoverIndexLocked() -> None:
+    try:
+        tmpPath = getCoverIndexPath() + ".tmp"
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            json.dump({"version": COVER_INDEX_VERSION, "entries": coverIndex}, f)
+        os.replace(tmpPath, getCoverIndexPath())
+    except Exception as e:
+        logWarning(f"Failed to save cover index: {e}")
+
+
+def isAllowedCoverUrl(url: str) -> bool:
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+    host = (parsed.hostname or "").lower()
+    if parsed.scheme != "https" or not host:
+        return False
+    return any(host == suffix or host.endswith("." + suffix) for suffix in COVER_ALLOWED_HOST_SUFFIXES)
+
+
+def getCoverFilePath(contentHash: str, contentType: str, width: int | None = None) -> str:
+    extension = COVER_FILE_EXTENSIONS.get(contentType, "img")
+    fileName = f"{contentHash}-w{width}.{extension}" if width else f"{contentHash}.{extension}"
+    return os.path.join(COVER_CACHE_DIR, fileName)
+
+
+def touchCoverFile(path: str) -> bool:
+    try:
+        os.utime(path, None)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def writeCoverFile(path: str, data: bytes) -> None:
+    tmpPath = path + ".tmp"
+    with open(tmpPath, "wb") as f:
+        f.write(data)
+    os.replace(tmpPath, path)
+
+
+def fetchCoverBytes(url: str) -> tuple[bytes, str]:
+    fetchUrl = url
+    for _ in range(COVER_MAX_REDIRECTS + 1):
+        with getHttpSession().get(fetchUrl, headers={"User-Agent": "Mozilla/5.0"}, timeout=10, stream=True, allow_redirects=False) as response:
+            if response.is_redirect:
+                fetchUrl = urljoin(fetchUrl, response.headers.get("Location") or "")
+                if not isAllowedCoverUrl(fetchUrl):
+                    raise ValueError(f"redirect to disallowed URL {fetchUrl}")
+                continue
+
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+
+            contentType = (response.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+            if contentType not in COVER_FILE_EXTENSIONS:
+                raise ValueError(f"unsupported content type {contentType or 'unknown'}")
+
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                received += len(chunk)
+                if received > COVER_MAX_FETCH_BYTES:
+                    raise ValueError("cover exceeds size limit")
+                chunks.append(chunk)
+
+        return b"".join(chunks), contentType
+
+    raise ValueError(f"more than {COVER_MAX_REDIRECTS} redirects")
+
+
+def getCachedCoverOriginal(url: str) -> tuple[str, str, str]:
+    with coverCacheLock:
+        loadCoverIndexLocked()
+        entry = coverIndex.get(url)
+
+    if entry:
+        path = getCoverFilePath(entry["hash"], entry["contentType"])
+        if touchCoverFile(path):
+            with coverCacheLock:
+                coverCacheStats["hits"] += 1
+            return path, entry["hash"], entry["contentType"]
+
+    with coverCacheLock:
+        coverCacheStats["misses"] += 1
+
+    data, contentType = fetchCoverBytes(url)
+    contentHash = hashlib.sha256(data).hexdigest()
+    path = getCoverFilePath(contentHash, contentType)
+    if not touchCoverFile(path):
+        writeCoverFile(path, data)
+
+    with coverCacheLock:
+        coverIndex[url] = {"hash": contentHash, "contentType": contentType}
+        saveCoverIndexLocked()
+
+    enforceCoverCacheBound()
+    return path, contentHash, contentType
+
+
+def resolveCoverWidth(requestedWidth: int | None) -> int | None:
+    if not requestedWidth or requestedWidth <= 0:
+        return None
+    for width in COVER_THUMBNAIL_WIDTHS:
+        if requestedWidth <= width:
+            return width
+    return COVER_THUMBNAIL_WIDTHS[-1]
+
+
+def buildCoverThumbnail(sourcePath: str, targetPath: str, width: int) -> bool:
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+
+    with Image.open(sourcePath) as image:
+        imageFormat = image.format
+        if image.width <= width:
+            return False
+
+        image.thumbnail((width, width * 4))
+        saveOptions = {}
+        if imageFormat == "JPEG":
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            saveOptions = {"quality": 85, "optimize": True}
+
+        tmpPath = targetPath + ".tmp"
+        image.save(tmpPath, format=imageFormat, **saveOptions)
+    os.replace(tmpPath, targetPath)
+
+    with coverCacheLock:
+        coverCacheStats["thumbnailsBuilt"] += 1
+    return True
+
+
+def getCoverFile(url: str, width: int | None) -> tuple[str, str, str]:
+    path, contentHash, contentType = getCachedCoverOriginal(url)
+    if not width:
+        return path, contentHash, contentType
+
+    thumbnailPath = getCoverFilePath(contentHash, contentType, width)
+    if touchCoverFile(thumbnailPath):
+        return thumbnailPath, f"{contentHash}-w{width}", contentType
+
+    try:
+        if buildCoverThumbnail(path, thumbnailPath, width):
+            enforceCoverCacheBound()
+            return thumbnailPath, f"{contentHash}-w{width}", contentType
+    except Exception as e:
+        logWarning(f"Cover thumbnail failed; serving original: {e}")
+
+    return path, contentHash, contentType
+
+
+def enforceCoverCacheBound() -> None:
+    with configLock:
+        maxBytes = int(CONFIG.get("cover_cache_max_mb", 64)) * 1024 * 1024
+
+    with coverCacheLock:
+        files = []
+        totalBytes = 0
+        try:
+            with os.scandir(COVER_CACHE_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_file() or entry.name.startswith("index.json") or entry.name.endswith(".tmp"):
+                        continue
+                    fileStat = entry.stat()
+                    files.append((fileStat.st_mtime, fileStat.st_size, entry.path))
+                    totalBytes += fileStat.st_size
+        except FileNotFoundError:
+            return
+
+        removedHashes = set()
+        if totalBytes > maxBytes:
+            for _, fileSize, path in sorted(files):
+                if totalBytes <= maxBytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                totalBytes -= fileSize
+                coverCacheStats["evictions"] += 1
+                baseName = os.path.basename(path).split(".", 1)[0]
+                if "-w" not in baseName:
+                    removedHashes.add(baseName)
+
+        if removedHashes:
+            for url in [url for url, entry in coverIndex.items() if entry.get("hash") in removedHashes]:
+                del coverIndex[url]
+            saveCoverIndexLocked()
+
+        coverCacheStats["bytes"] = totalBytes
+
+
+def getCoverCacheStats() -> dict:
+    with coverCacheLock:
+        data = dict(coverCacheStats)
+        data["indexedUrls"] = len(coverIndex)
+    return data
+
+
+PROFILE_DIR = os.path.join(appDataDir, "profiles")
+PROFILE_DEFAULT_SECONDS = 15
+PROFILE_MAX_SECONDS = 300
+PROFILE_DEFAULT_INTERVAL_MS = 10
+PROFILE_KEEP_FILES = 10
+PROFILE_TOP_FRAMES = 25
+
+profileLock = threading.Lock()
+profileStopEvent = threading.Event()
+profileState = {"running": False, "startedAt": None, "seconds": None, "intervalMs": None, "path": None, "lastResult": None}
+
+
+def getProfileFrameLabel(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def sampleThreadStacks(seconds: float, intervalSeconds: float) -> tuple[dict, int]:
+    profilerThreadId = threading.get_ident()
+    stackCounts = {}
+    threadNames = {}
+    sampleCount = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline and not profileStopEvent.is_set():
+        frames = sys._current_frames()
+        if any(threadId not in threadNames for threadId in frames):
+            threadNames = {thread.ident: thread.name for thread in threading.enumerate()}
+
+        for threadId, frame in frames.items():
+            if threadId == profilerThreadId:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(getProfileFrameLabel(frame))
+                frame = frame.f_back
+            stack.append(threadNames.get(threadId, f"thread-{threadId}"))
+            stackKey = ";".join(reversed(stack))
+            stackCounts[stackKey] = stackCounts.get(stackKey, 0) + 1
+
+        sampleCount += 1
+        profileStopEvent.wait(intervalSeconds)
+
+    return stackCounts, sampleCount
+
+
+def summarizeProfileStacks(stackCounts: dict) -> dict:
+    selfCounts = {}
+    inclusiveCounts = {}
+    for stackKey, count in stackCounts.items():
+        frames = stackKey.split(";")[1:]
+        if frames:
+            selfCounts[frames[-1]] = selfCounts.get(frames[-1], 0) + count
+        for frameLabel in set(frames):
+            inclusiveCounts[frameLabel] = inclusiveCounts.get(frameLabel, 0) + count
+
+    def top(counts: dict) -> list[dict]:
+        ordered = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:PROFILE_TOP_FRAMES]
+        return [{"frame": frameLabel, "samples": count} for frameLabel, count in ordered]
+
+    return {"topSelf": top(selfCounts), "topInclusive": top(inclusiveCounts)}
+
+
+def pruneProfileFiles() -> None:
+    try:
+        names = sorted(name for name in os.listdir(PROFILE_DIR) if name.endswith(".folded"))
+    except FileNotFoundError:
+        return
+    for name in names[:-PROFILE_KEEP_FILES]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, name))
+        except OSError:
+            pass
+
+
+def runProfileSession(seconds: float, intervalMs: int, path: str) -> None:
+    result = {"path": path, "seconds": seconds, "intervalMs": intervalMs}
+    try:
+        startedAt = time.perf_counter()
+        stackCounts, sampleCount = sampleThreadStacks(seconds, intervalMs / 1000)
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        tmpPath = f"{path}.tmp"
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            for stackKey, count in sorted(stackCounts.items(), key=lambda item: item[1], reverse=True):
+                f.write(f"{stackKey} {count}\n")
+        os.replace(tmpPath, path)
+        pruneProfileFiles()
+
+        result.update(summarizeProfileStacks(stackCounts))
+        result["samples"] = sampleCount
+        result["elapsedSeconds"] = round(time.perf_counter() - startedAt, 3)
+        logInfo(f"Profile written to {path} ({sampleCount} sample(s)).", uiStatus=None)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        logError(f"Profiling session failed: {e}", uiStatus=None, exc=e)
+    finally:
+        with profileLock:
+            profileState["running"] = False
+            profileState["lastResult"] = result
+
+
+def startProfileSession(seconds: float, intervalMs: int) -> str | None:
+    with profileLock:
+        if profileState["running"]:
+            return None
+        path = os.path.join(PROFILE_DIR, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.folded")
+        profileState.update({"running": True, "startedAt": time.time(), "seconds": seconds, "intervalMs": intervalMs, "path": path})
+        profileStopEvent.clear()
+
+    threading.Thread(target=runProfileSession, args=(seconds, intervalMs, path), daemon=True, name="ProfilerThread").start()
+    return path
+
+
+def getProfileStatus() -> dict:
+    with profileLock:
+        data = dict(profileState)
+    try:
+        data["files"] = sorted(name for name in os.listdir(PROFILE_DIR) if name.endswith(".folded"))
+    except FileNotFoundError:
+        data["files"] = []
+    data["dir"] = PROFILE_DIR
+    return data
+
+
+@app.before_request
+def startRequestTimer():
+    g.requestStartedAt = time.perf_counter()
+
+
+@app.after_request
+def recordRequestMetrics(response):
+    startedAt = g.get("requestStartedAt")
+    if startedAt is not None:
+        endpoint = request.endpoint or "unmatched"
+        metrics.observe("grrpc_http_request_duration_seconds", time.perf_counter() - startedAt, endpoint=endpoint)
+        metrics.inc("grrpc_http_requests_total", endpoint=endpoint, method=request.method, status=str(response.status_code))
+    return response
+
+
+metrics.gauge("grrpc_uptime_seconds", "Seconds since the backend module was imported.", lambda: time.perf_counter() - processStartedAt)
+metrics.gauge("grrpc_book_snapshot_version", "Version of the current book snapshot.", lambda: getBookSnapshot().version)
+metrics.gauge("grrpc_presence_running", "1 while the presence loop holds a Discord session.", lambda: 1 if is_running_event.is_set() else 0)
+metrics.gauge("grrpc_discord_connected", "1 while the Discord IPC connection is up.", lambda: 1 if discordConnection.isConnected() else 0)
+metrics.gauge("grrpc_event_subscribers", "Connected /api/events subscribers.", lambda: getEventStreamStats().get("subscribers"))
+metrics.gauge("grrpc_books_cache_entries", "Entries in the books cache.", lambda: booksCacheStore.getStats()["size"])
+metrics.gauge("grrpc_cover_cache_bytes", "Bytes on disk in the cover cache at the last eviction scan.", lambda: getCoverCacheStats()["bytes"])
+
+
+@app.route("/api/metrics", methods=["GET"])
+def metrics_endpoint():
+    try:
+        return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+    except Exception as e:
+        return safeJsonifyError(e, 500, "metrics")
+
+
+@app.route("/api/debug/spans", methods=["GET"])
+def debug_spans():
+    try:
+        limit = max(1, min(SPAN_BUFFER_SIZE, request.args.get("limit", default=200, type=int)))
+        name = request.args.get("name") or None
+        traceId = request.args.get("trace", type=int)
+        return jsonify({
+            "spans": getRecentSpans(limit, name, traceId),
+            "summary": getSpanSummary(),
+            "bufferSize": SPAN_BUFFER_SIZE,
+        }), 200
+    except Exception as e:
+        return safeJsonifyError(e, 500, "debug_spans")
+
+
+@app.route("/api/debug/profile", methods=["GET"])
+def debug_profile_status():
+    try:
+        return jsonify(getProfileStatus()), 200
+    except Exception as e:
+        return safeJsonifyError(e, 500, "debug_profile_status")
+
+
+@app.route("/api/debug/profile", methods=["POST"])
+def debug_profile_start():
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            seconds = float(data.get("seconds", PROFILE_DEFAULT_SECONDS))
+            intervalMs = int(data.get("intervalMs", PROFILE_DEFAULT_INTERVAL_MS))
+        except (TypeError, ValueError):
+            return jsonify({"error": "Invalid seconds or intervalMs"}), 400
+
+        seconds = max(1.0, min(PROFILE_MAX_SECONDS, seconds))
+        intervalMs = max(1, min(1000, intervalMs))
+
+        path = startProfileSession(seconds, intervalMs)
+        if path is None:
+            return jsonify({"error": "A profiling session is already running", "profile": getProfileStatus()}), 409
+        return jsonify({"started": True, "path": path, "seconds": seconds, "intervalMs": intervalMs}), 202
+    except Exception as e:
+        return safeJsonifyError(e, 500, "debug_profile_start")
+
+
+@app.route("/api/hello")
+def hello():
+    try:
+        updateStatus("Info", "Hello ping")
+        return jsonify({"message": "Hello from Flask!"})
+    except Exception as e:
+        return safeJsonifyError(e, 500, "hello")
+
+
+@app.route("/api/ready", methods=["GET"])
+def ready():
+    try:
+        warmed = warmupDoneEvent.is_set()
+        with startupTimingsLock:
+            phases = dict(startupTimings)
+        data = {"listening": True, "warmed": warmed, "phases": phases}
+        return jsonify(data), 200 if warmed else 503
+    except Exception as e:
+        return safeJsonifyError(e, 500, "ready")
+
+
+@app.route("/api/health", methods=["GET"])
+def health():
+    try:
+        cfg = getPlatformConfigSnapshot()
+        latestEvent = getLatestStatusEvent()
+
+        data = {
+            "ok": True,
+            "platform": cfg["platform"],
+            "presenceRequested": should_run_event.is_set(),
+            "presenceRunning": is_running_event.is_set(),
+            "playwrightBrowsersPath": os.environ.get("PLAYWRIGHT_BROWSERS_PATH"),
+            "storygraphBrowser": storygraphBrowserPool.getStats(),
+            "storygraphFetch": getStoryGraphFetchStats(),
+            "goodreadsFetch": getScrapeValidatorStats(),
+            "booksCache": getBooksCacheStats(),
+            "rowMemo": {"goodreads": goodreadsRowMemo.getStats(), "storygraph": storygraphRowMemo.getStats()},
+            "scrapeSingleFlight": getScrapeFlightStats(),
+            "coverCache": getCoverCacheStats(),
+            "presenceUpdates": getPresenceStats(),
+            "bookSnapshot": getBookSnapshotStats(),
+            "configPersistence": getConfigSaveStats(),
+            "discordConnection": discordConnection.getStats(),
+            "eventStream": getEventStreamStats(),
+            "tracing": {"bufferedSpans": len(recentSpans), "bufferSize": SPAN_BUFFER_SIZE},
+            "profiling": {"running": profileState["running"], "path": profileState["path"]},
+            "server": getServerInfo(),
+            "lastStatus": latestEvent.status if latestEvent else None,
+            "lastMessage": latestEvent.message if latestEvent else None,
+            "lastUpdated": latestEvent.lastUpdated if latestEvent else None,
+            "statusSeq": latestEvent.seq if latestEvent else 0,
+        }
+        return jsonify(data), 200
+    except Exception as e:
+        return safeJsonifyError(e, 500, "health")
+
+
+@app.route("/api/scraper/get_books", methods=["GET"])
+def scraper_get_books():
+    try:
+        scraped, stale = getBooksCachedWithState()
+        if not scraped:
+            updateStatus("Error", "No books found.")
+            return jsonify({"error": "No books found."}), 404
+
+        snapshot = installScrapedBooks(scraped)
+
+        init_event.set()
+        wakePresenceLoop()
+        publishEvent("books", {"books": snapshot.books, "currentIsbn": snapshot.currentIsbn, "stale": stale, "version": snapshot.version})
+        updateStatus("Active", f"Books ready (current: {snapshot.currentIsbn}{', refreshing' if stale else ''})")
+        headers = {"X-Books-Stale": "1" if stale else "0", "X-Books-Version": str(snapshot.version)}
+        return jsonify([snapshot.books, snapshot.currentIsbn]), 200, headers
+
+    except Exception as e:
+        return safeJsonifyError(e, 500, "scraper_get_books")
 
 
 @app.route("/api/scraper/refresh", methods=["POST"])
 def scraper_refresh():
     try:
-        with booksCacheLock:
-            booksCache["timestamp"] = 0
-            booksCache["platform"] = None
-            booksCache["data"] = None
-        updateStatus("Info", "Books cache cleared")
-        logInfo("Books cache cleared.", uiStatus=None)
-        return jsonify({"message": "Cache cleared."}), 200
+        payload = request.get_json(silent=True) or {}
+
+        if payload.get("current"):
+            scrapeKey = getScrapeKey(getPlatformConfigSnapshot())
+            cleared = booksCacheStore.invalidate(lambda key: key == scrapeKey)
+            scope = f"{scrapeKey[0]} user {scrapeKey[1]}"
+        elif payload.get("platform"):
+            platform = str(payload["platform"]).strip().lower()
+            userId = str(payload["userId"]).strip() if payload.get("userId") is not None else None
+            cleared = invalidateBooksCache(platform, userId)
+            scope = f"{platform} user {userId}" if userId is not None else platform
+        else:
+            cleared = invalidateBooksCache()
+            scope = "all users"
+
+        updateStatus("Info", f"Books cache cleared ({scope})")
+        logInfo(f"Books cache cleared for {scope}: {cleared} entr{'y' if cleared == 1 else 'ies'}.", uiStatus=None)
+        return jsonify({"message": "Cache cleared.", "cleared": cleared, "scope": scope}), 200
     except Exception as e:
         return safeJsonifyError(e, 500, "scraper_refresh")
 
@@ -703,8 +2972,7 @@ def shutdown():
     try:
         updateStatus("Info", "Shutdown requested")
         logInfo("Shutdown requested.", uiStatus=None)
-        pid = os.getpid()
-        threading.Thread(target=lambda: os.kill(pid, signal.SIGTERM), daemon=True).start()
+        threading.Thread(target=stopServer, daemon=True, name="ShutdownThread").start()
         return jsonify({"message": "Flask shutting down..."})
     except Exception as e:
         return safeJsonifyError(e, 500, "shutdown")
@@ -740,9 +3008,11 @@ def update_config():
             CONFIG.update(data)
 
         applyConfigToRuntimeState()
+        wakePresenceLoop()
 
         updateStatus("Active", "Config updated (unsaved)")
         logInfo("Config updated (unsaved).", uiStatus=None)
+        currentIsbn = getBookSnapshot().currentIsbn
         return jsonify({"message": "Config updated successfully.", "currentIsbn": currentIsbn, "current_isbn": currentIsbn})
     except Exception as e:
         return safeJsonifyError(e, 500, "update_config")
@@ -757,11 +3027,13 @@ def save_config():
         with configLock:
             CONFIG.update(updatedConfig)
 
-        save_config_internal()
+        scheduleConfigSave()
         applyConfigToRuntimeState()
+        wakePresenceLoop()
 
         updateStatus("Active", "Config saved")
         logInfo("Config saved.", uiStatus=None)
+        currentIsbn = getBookSnapshot().currentIsbn
         return jsonify({"message": "Config saved successfully.", "currentIsbn": currentIsbn, "current_isbn": currentIsbn})
     except Exception as e:
         return safeJsonifyError(e, 500, "save_config")
@@ -770,20 +3042,19 @@ def save_config():
 @app.route("/api/book/select", methods=["POST"])
 def select_book():
     try:
-        global currentIsbn, currentBook, books
         data = request.get_json(silent=True) or {}
         isbn = (data.get("isbn") or "").strip()
 
-        with booksLock:
-            if isbn and isbn in books:
-                currentIsbn = isbn
-                currentBook = books[isbn]
-                with configLock:
-                    CONFIG["current_isbn"] = isbn
-                save_config_internal()
-                updateStatus("Active", "Book selected")
-                logInfo(f"Book selected: {isbn}", uiStatus=None)
-                return jsonify({"message": "Book selected.", "currentIsbn": currentIsbn, "current_isbn": currentIsbn})
+        previous, snapshot = swapBookSnapshot(lambda current: (current.books, isbn) if isbn and isbn in current.books else None)
+        if snapshot is not previous:
+            with configLock:
+                CONFIG["current_isbn"] = isbn
+            scheduleConfigSave()
+            wakePresenceLoop()
+            publishEvent("books", {"books": snapshot.books, "currentIsbn": isbn, "stale": False, "version": snapshot.version})
+            updateStatus("Active", "Book selected")
+            logInfo(f"Book selected: {isbn}", uiStatus=None)
+            return jsonify({"message": "Book selected.", "currentIsbn": isbn, "current_isbn": isbn, "version": snapshot.version})
 
         updateStatus("Error", "Invalid ISBN.")
         return jsonify({"error": "Invalid ISBN."}), 400
@@ -795,47 +3066,111 @@ def select_book():
 @app.route("/api/book/current", methods=["GET"])
 def get_current_book():
     try:
-        return jsonify(currentBook)
+        snapshot = getBookSnapshot()
+        return jsonify(snapshot.currentBook), 200, {"X-Books-Version": str(snapshot.version)}
     except Exception as e:
         return safeJsonifyError(e, 500, "get_current_book")
 
 
+@app.route("/api/cover", methods=["GET"])
+def cover_proxy():
+    try:
+        url = (request.args.get("url") or "").strip()
+        if not isAllowedCoverUrl(url):
+            return jsonify({"error": "Unsupported cover URL"}), 400
+
+        try:
+            requestedWidth = int(request.args["w"]) if request.args.get("w") else None
+        except ValueError:
+            return jsonify({"error": "Invalid width"}), 400
+
+        try:
+            path, etag, contentType = getCoverFile(url, resolveCoverWidth(requestedWidth))
+        except Exception as fetchErr:
+            with coverCacheLock:
+                coverCacheStats["fetchFailures"] += 1
+            logWarning(f"Cover fetch failed for {url}: {fetchErr}")
+            return jsonify({"error": "Cover unavailable"}), 502
+
+        response = send_file(path, mimetype=contentType, conditional=True, etag=etag, max_age=COVER_CACHE_MAX_AGE_SECONDS)
+        response.headers["Cache-Control"] = f"public, max-age={COVER_CACHE_MAX_AGE_SECONDS}, immutable"
+        return response
+    except Exception as e:
+        return safeJsonifyError(e, 500, "cover_proxy")
+
+
 @app.route("/api/status", methods=["GET"])
 def get_status():
     try:
-        with statusLock:
-            tempStatusInfo = {
-                "status": list(statusInfo["status"]),
-                "message": list(statusInfo["message"]),
-                "lastUpdated": list(statusInfo["lastUpdated"]),
-            }
-            statusInfo["status"].clear()
-            statusInfo["message"].clear()
-            statusInfo["lastUpdated"].clear()
-            statusInfo["status"].append("Idle")
-            statusInfo["message"].append(None)
-            statusInfo["lastUpdated"].append(None)
+        since = request.args.get("since", type=int)
+        journal = readStatusJournal(since)
+        events = journal["events"] or [{"seq": None, "status": "Idle", "message": None, "lastUpdated": None}]
+
+        tempStatusInfo = {
+            "status": [ev["status"] for ev in events],
+            "message": [ev["message"] for ev in events],
+            "lastUpdated": [ev["lastUpdated"] for ev in events],
+            **journal,
+        }
         return jsonify(tempStatusInfo)
     except Exception as e:
         return safeJsonifyError(e, 500, "get_status")
 
 
+@app.route("/api/events", methods=["GET"])
+def event_stream():
+    subscriberQueue = subscribeEvents()
+
+    latestEvent = getLatestStatusEvent()
+
+    def formatEvent(eventType: str, data) -> str:
+        return f"event: {eventType}\ndata: {json.dumps(data)}\n\n"
+
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            if latestEvent:
+                yield formatEvent("status", latestEvent._asdict())
+            yield formatEvent("presence", {"running": is_running_event.is_set(), "details": None})
+            while not serverStoppingEvent.is_set():
+                try:
+                    eventType, data = subscriberQueue.get(timeout=EVENT_STREAM_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield formatEvent(eventType, data)
+                if eventType == "shutdown":
+                    return
+        finally:
+            unsubscribeEvents(subscriberQueue)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(stream_with_context(generate()), mimetype="text/event-stream", headers=headers)
+
+
 @app.route("/api/presence/test", methods=["POST"])
 def presence_test():
     try:
-        from pypresence import Presence
         cfg = getPlatformConfigSnapshot()
         discordAppId = cfg["discord_app_id"]
 
         if not discordAppId:
             return jsonify({"ok": False, "error": "Discord App ID missing"}), 400
 
+        live = discordConnection.getStats()
+        if live["connected"] and live["appId"] == discordAppId:
+            message = f"Presence is connected to Discord RPC (up {live['uptimeSeconds']}s, {live['reconnects']} reconnect(s))."
+            updateStatus("Info", "Discord RPC test success (live connection)")
+            return jsonify({"ok": True, "live": True, "message": message, "connection": live}), 200
+
+        from pypresence import Presence
+
         p = Presence(discordAppId)
         p.connect()
         p.close()
         updateStatus("Info", "Discord RPC test success")
         logger.info("Discord RPC test success.")
-        return jsonify({"ok": True, "message": "Connected to Discord RPC successfully."}), 200
+        return jsonify({"ok": True, "live": False, "message": "Connected to Discord RPC successfully.", "connection": live}), 200
 
     except Exception as e:
         return safeJsonifyError(e, 500, "presence_test")
@@ -844,28 +3179,20 @@ def presence_test():
 @app.route("/api/presence/start", methods=["POST"])
 def presence_start():
     try:
-        global presenceThread, currentBook, books, currentIsbn
+        global presenceThread
 
         should_run_event.set()
 
-        with booksLock:
-            scraped = getBooksCached()
-            if not scraped:
-                updateStatus("Error", "No books found.")
-                return jsonify({"error": "No books found."}), 404
-
-            books = scraped
+        scraped = getBooksCached()
+        if not scraped:
+            updateStatus("Error", "No books found.")
+            return jsonify({"error": "No books found."}), 404
 
-            if (not currentIsbn) or (currentIsbn not in books):
-                currentBook = next(iter(books.values()))
-                currentIsbn = currentBook["isbn"]
-                with configLock:
-                    CONFIG["current_isbn"] = currentIsbn
-                save_config_internal()
-            else:
-                currentBook = books[currentIsbn]
+        snapshot = installScrapedBooks(scraped)
+        publishEvent("books", {"books": snapshot.books, "currentIsbn": snapshot.currentIsbn, "stale": False, "version": snapshot.version})
 
         init_event.set()
+        wakePresenceLoop()
 
         if presenceThread is None or not presenceThread.is_alive():
             presenceThread = threading.Thread(target=run_presence, daemon=True, name="PresenceThread")
@@ -885,8 +3212,7 @@ def presence_start():
 def presence_stop():
     try:
         should_run_event.clear()
-        stopSleepEvent.set()
-        stopSleepEvent.clear()
+        wakePresenceLoop()
         updateStatus("Active", "Presence stop requested")
         logInfo("Presence stop requested.", uiStatus=None)
         return jsonify({"message": "Presence loop stopped."})
@@ -894,13 +3220,243 @@ def presence_stop():
         return safeJsonifyError(e, 500, "presence_stop")
 
 
-def run_presence():
-    global currentBook
+presenceStatsLock = threading.Lock()
+presenceStats = {"sent": 0, "skipped": 0, "keepalives": 0, "failed": 0, "wakeups": 0}
+
+
+def bumpPresenceStat(key: str) -> None:
+    with presenceStatsLock:
+        presenceStats[key] += 1
+    metrics.inc("grrpc_presence_updates_total", result=key)
+
+
+def getPresenceStats() -> dict:
+    with presenceStatsLock:
+        return dict(presenceStats)
+
+
+def wakePresenceLoop() -> None:
+    presenceWakeEvent.set()
+
+
+DISCORD_RECONNECT_BASE_SECONDS = 1.0
+DISCORD_RECONNECT_MAX_SECONDS = 60.0
+
+
+# pypresence's sync client is tied to the asyncio loop of the thread that connected it, so only
+# the presence thread drives this; other threads just read its stats.
+class DiscordConnection:
+    def __init__(self):
+        self.statsLock = threading.Lock()
+        self.stats = {"connects": 0, "reconnects": 0, "connectFailures": 0, "disconnects": 0, "replays": 0, "rejected": 0}
+        self.appId = None
+        self.connectedAt = None
+        self.everConnected = False
+        self.consecutiveFailures = 0
+        self.nextAttemptAt = 0.0
+        self.lastError = None
+        self.lastActivity = None
+        self.lastActivityAt = None
+        self.deliveredFingerprint = None
+        self.lastSentAt = 0.0
+
+        # Owned by the presence thread only.
+        self.presence = None
+
+    def bumpStat(self, key: str) -> None:
+        with self.statsLock:
+            self.stats[key] += 1
+
+    def isConnected(self) -> bool:
+        return self.presence is not None
+
+    def getRetryDelay(self) -> float:
+        return max(0.0, self.nextAttemptAt - time.time())
+
+    def ensureConnected(self, appId: str) -> bool:
+        if self.presence is not None and self.appId == appId:
+            return True
+        if self.presence is not None:
+            self.disconnect("Discord App ID changed")
+            self.everConnected = False
+            self.consecutiveFailures = 0
+            self.nextAttemptAt = 0.0
+        if time.time() < self.nextAttemptAt:
+            return False
+
+        from pypresence import Presence
+
+        presence = None
+        try:
+            presence = Presence(appId)
+            presence.connect()
+        except Exception as e:
+            if presence is not None:
+                try:
+                    presence.loop.close()
+                except Exception:
+                    pass
+            self.bumpStat("connectFailures")
+            delay = self.scheduleRetry(f"{type(e).__name__}: {e}")
+            logWarning(f"Discord connect failed ({self.lastError}); retrying in {delay:.1f}s.", uiStatus="Error")
+            return False
+
+        isReconnect = self.everConnected
+        with self.statsLock:
+            self.presence = presence
+            self.appId = appId
+            self.connectedAt = time.time()
+            # A reconnect only counts as recovered once the replayed activity gets through.
+            if not isReconnect or self.lastActivity is None:
+                self.consecutiveFailures = 0
+            self.nextAttemptAt = 0.0
+            self.lastError = None
+            self.stats["reconnects" if isReconnect else "connects"] += 1
+        self.everConnected = True
+
+        if isReconnect:
+            updateStatus("Active", "Discord presence reconnected")
+            logger.info("Discord presence reconnected.")
+            if self.lastActivity is not None:
+                if self.update(self.lastActivity, json.dumps(self.lastActivity, sort_keys=True)):
+                    self.bumpStat("replays")
+        else:
+            updateStatus("Active", "Discord presence connected")
+            logger.info("Discord presence connected.")
+        return self.presence is not None
+
+    def scheduleRetry(self, reason: str) -> float:
+        backoff = min(DISCORD_RECONNECT_MAX_SECONDS, DISCORD_RECONNECT_BASE_SECONDS * (2 ** self.consecutiveFailures))
+        delay = random.uniform(backoff / 2, backoff)
+        with self.statsLock:
+            self.consecutiveFailures += 1
+            self.nextAttemptAt = time.time() + delay
+            self.lastError = reason
+        return delay
+
+    def isTransportError(self, error: Exception) -> bool:
+        from pypresence.exceptions import ConnectionTimeout, DiscordNotFound, InvalidPipe, PipeClosed, ResponseTimeout
+
+        return isinstance(error, (PipeClosed, ResponseTimeout, ConnectionTimeout, InvalidPipe, DiscordNotFound, OSError, TimeoutError))
+
+    def update(self, payload: dict, fingerprint: str) -> bool:
+        self.lastActivity = payload
+        if self.presence is None:
+            return False
+        try:
+            self.presence.update(**payload)
+        except Exception as e:
+            reason = f"{type(e).__name__}: {e}"
+            if self.isTransportError(e):
+                self.disconnect(reason)
+                return False
+
+            # Discord refused this payload (e.g. ServerError for an over-long title); the socket is
+            # fine, so hold the fingerprint and only retry once the payload changes or a keepalive is due.
+            with self.statsLock:
+                self.stats["rejected"] += 1
+                self.lastError = reason
+            self.deliveredFingerprint = fingerprint
+            self.lastSentAt = time.time()
+            logWarning(f"Discord rejected the presence update ({reason}).", uiStatus="Error")
+            return False
+        self.deliveredFingerprint = fingerprint
+        self.lastSentAt = time.time()
+        self.lastActivityAt = self.lastSentAt
+        with self.statsLock:
+            self.consecutiveFailures = 0
+        return True
+
+    def disconnect(self, reason: str | None = None) -> None:
+        presence = self.presence
+        if presence is None:
+            return
+        try:
+            presence.close()
+        except Exception:
+            pass
+        with self.statsLock:
+            self.presence = None
+            self.connectedAt = None
+            self.deliveredFingerprint = None
+            self.stats["disconnects"] += 1
+        if reason:
+            delay = self.scheduleRetry(reason)
+            logWarning(f"Discord connection lost ({reason}); reconnecting in {delay:.1f}s.", uiStatus="Error")
+
+    def shutdown(self) -> None:
+        if self.presence is not None:
+            try:
+                self.presence.clear()
+            except Exception:
+                pass
+        self.disconnect()
+        self.lastActivity = None
+        self.everConnected = False
+        self.consecutiveFailures = 0
+        self.nextAttemptAt = 0.0
+
+    def getStats(self) -> dict:
+        with self.statsLock:
+            data = dict(self.stats)
+            data["connected"] = self.presence is not None
+            data["appId"] = self.appId
+            data["uptimeSeconds"] = round(time.time() - self.connectedAt, 1) if self.connectedAt else None
+            data["consecutiveFailures"] = self.consecutiveFailures
+            data["nextRetrySeconds"] = round(self.getRetryDelay(), 1) if self.presence is None and self.nextAttemptAt else None
+            data["lastError"] = self.lastError
+            data["lastActivityAt"] = self.lastActivityAt
+        return data
+
+
+discordConnection = DiscordConnection()
+
+
+def buildPresencePayload(book: dict | None, cfg: dict) -> dict | None:
+    if not book:
+        return None
+
+    startTs = None
+    try:
+        if book.get("startDate"):
+            startTs = int(time.mktime(time.strptime(book["startDate"], "%b %d, %Y")))
+    except Exception:
+        startTs = None
+
+    if cfg["platform"] == "storygraph":
+        largeText = "Reading via StoryGraph"
+        buttonUrl = book.get("bookUrl") or f"https://app.thestorygraph.com/currently-reading/{cfg['storygraph_username']}"
+        buttonLabel = "View on StoryGraph"
+    else:
+        largeText = "Reading via Goodreads"
+        buttonUrl = f"https://www.goodreads.com/review/list/{cfg['goodreads_id']}?shelf=currently-reading"
+        buttonLabel = "View Goodreads"
+
+    return {
+        "details": book.get("title") or "Unknown Title",
+        "state": f"by {book.get('author') or 'Unknown Author'}",
+        "large_image": "book",
+        "large_text": largeText,
+        "start": startTs,
+        "buttons": [{"label": buttonLabel, "url": buttonUrl}] if buttonUrl and buttonLabel else None,
+    }
+
+
+def setPresenceRunning(running: bool) -> None:
+    if running == is_running_event.is_set():
+        return
+    if running:
+        is_running_event.set()
+    else:
+        is_running_event.clear()
+    publishEvent("presence", {"running": running, "details": None})
+
 
+def run_presence():
     logInfo("Presence thread running.", uiStatus="Info")
 
     try:
-        from pypresence import Presence
+        import pypresence  # noqa: F401
     except Exception as e:
         logError(f"pypresence import failed: {e}", uiStatus="Error", exc=e)
         return
@@ -911,85 +3467,77 @@ def run_presence():
             logWarning("Presence init timed out.", uiStatus="Error")
             return
 
-        cfg = getPlatformConfigSnapshot()
-        discordAppId = cfg["discord_app_id"]
-        if not discordAppId:
-            logWarning("Discord App ID missing.", uiStatus="Error")
-            return
-
-        presence = Presence(discordAppId)
-        try:
-            presence.connect()
-        except Exception as e:
-            logError(f"Discord connect failed: {e}", uiStatus="Error", exc=e)
-            return
-
-        is_running_event.set()
-        updateStatus("Active", "Discord presence connected")
-        logger.info("Discord presence connected.")
+        noBookReported = False
 
         try:
             while should_run_event.is_set():
+                presenceWakeEvent.clear()
                 cfg = getPlatformConfigSnapshot()
-                platform = cfg["platform"]
-                goodreadsId = cfg["goodreads_id"]
-                storygraphUsername = cfg["storygraph_username"]
-
-                with booksLock:
-                    book = currentBook
 
-                if book:
-                    startTs = None
-                    try:
-                        if book.get("startDate"):
-                            startTs = int(time.mktime(time.strptime(book["startDate"], "%b %d, %Y")))
-                    except Exception:
-                        startTs = None
-
-                    largeImage = "book"
-                    largeText = "Reading"
-                    buttonUrl = None
-                    buttonLabel = None
-
-                    if platform == "storygraph":
-                        largeText = "Reading via StoryGraph"
-                        buttonUrl = book.get("bookUrl") or f"https://app.thestorygraph.com/currently-reading/{storygraphUsername}"
-                        buttonLabel = "View on StoryGraph"
-                    else:
-                        largeText = "Reading via Goodreads"
-                        buttonUrl = f"https://www.goodreads.com/review/list/{goodreadsId}?shelf=currently-reading"
-                        buttonLabel = "View Goodreads"
-
-                    try:
-                        presence.update(
-                            details=book.get("title") or "Unknown Title",
-                            state=f"by {book.get('author') or 'Unknown Author'}",
-                            large_image=largeImage,
-                            large_text=largeText,
-                            start=startTs,
-                            buttons=[{"label": buttonLabel, "url": buttonUrl}] if buttonUrl and buttonLabel else None,
-                        )
-                        updateStatus("Active", f"Presence updated: {book.get('title') or 'Unknown Title'}")
-                    except Exception as updateErr:
-                        logError(f"Presence update failed: {updateErr}", uiStatus="Error", exc=updateErr)
-                else:
-                    updateStatus("Info", "No current book selected")
+                discordAppId = cfg["discord_app_id"]
+                if not discordAppId:
+                    logWarning("Discord App ID missing.", uiStatus="Error")
+                    return
 
                 try:
                     interval = int(cfg.get("update_interval", 60)) or 60
                 except Exception:
                     interval = 60
-
                 waitSeconds = max(5, min(600, interval))
-                stopSleepEvent.wait(timeout=waitSeconds)
+
+                with traceSpan("presence.connect") as span:
+                    connected = discordConnection.ensureConnected(discordAppId)
+                    span.set(connected=connected)
+                if not connected:
+                    setPresenceRunning(False)
+                    if presenceWakeEvent.wait(timeout=max(0.5, min(waitSeconds, discordConnection.getRetryDelay()))):
+                        bumpPresenceStat("wakeups")
+                    continue
+
+                setPresenceRunning(True)
+
+                book = getBookSnapshot().currentBook
+
+                payload = buildPresencePayload(book, cfg)
+                fingerprint = json.dumps(payload, sort_keys=True)
+
+                try:
+                    keepaliveSeconds = int(cfg.get("presence_keepalive_seconds", 300))
+                except Exception:
+                    keepaliveSeconds = 300
+
+                keepaliveDue = keepaliveSeconds > 0 and (time.time() - discordConnection.lastSentAt) >= keepaliveSeconds
+
+                if payload is None:
+                    if noBookReported:
+                        bumpPresenceStat("skipped")
+                    else:
+                        noBookReported = True
+                        updateStatus("Info", "No current book selected")
+                elif fingerprint == discordConnection.deliveredFingerprint and not keepaliveDue:
+                    noBookReported = False
+                    bumpPresenceStat("skipped")
+                else:
+                    noBookReported = False
+                    isKeepalive = fingerprint == discordConnection.deliveredFingerprint
+                    with traceSpan("presence.update", keepalive=isKeepalive) as span:
+                        delivered = discordConnection.update(payload, fingerprint)
+                        span.set(delivered=delivered)
+                    if delivered:
+                        bumpPresenceStat("keepalives" if isKeepalive else "sent")
+                        publishEvent("presence", {"running": True, "details": payload["details"], "state": payload["state"]})
+                        updateStatus("Active", f"Presence updated: {payload['details']}")
+                    else:
+                        bumpPresenceStat("failed")
+                        if not discordConnection.isConnected():
+                            continue
+
+                if presenceWakeEvent.wait(timeout=waitSeconds):
+                    bumpPresenceStat("wakeups")
 
         finally:
-            is_running_event.clear()
-            try:
-                presence.clear()
-                presence.close()
-            except Exception:
-                pass
+            discordConnection.shutdown()
+            setPresenceRunning(False)
             updateStatus("Info", "Presence cleared")
             logger.info("Presence cleared.")
 
@@ -998,12 +3546,147 @@ def run_presence():
         is_running_event.clear()
 
 
+SERVER_HOST = "localhost"
+SERVER_PORT = 5000
+
+serverLock = threading.Lock()
+serverStopHook = None
+serverStoppingEvent = threading.Event()
+serverInfo = {"mode": None, "threads": None, "timeoutSeconds": None, "keepAlive": None}
+
+
+def getServerInfo() -> dict:
+    with serverLock:
+        return dict(serverInfo)
+
+
+startupTimingsLock = threading.Lock()
+startupTimings = {}
+warmupDoneEvent = threading.Event()
+
+
+def recordStartupPhase(phaseName: str, phaseStartedAt: float) -> None:
+    now = time.perf_counter()
+    elapsed = round(now - phaseStartedAt, 3)
+    with startupTimingsLock:
+        startupTimings[phaseName] = elapsed
+    logInfo(f"Startup phase {phaseName} took {elapsed}s ({round(now - processStartedAt, 3)}s since import).", uiStatus=None)
+
+
+def initializeRuntimeState() -> None:
+    load_config()
+    applyConfigToRuntimeState()
+    seedBooksCacheFromDisk()
+
+
+def warmHtmlParser() -> None:
+    import bs4  # noqa: F401
+
+    getHtmlParserBackend()
+
+
+def warmUpInBackground() -> None:
+    for phaseName, phaseFn in (
+        ("httpSession", getHttpSession),
+        ("htmlParser", warmHtmlParser),
+        ("playwrightBrowsers", preparePlaywrightBrowsers),
+    ):
+        phaseStartedAt = time.perf_counter()
+        try:
+            phaseFn()
+        except Exception as e:
+            logError(f"Startup phase {phaseName} failed: {e}", uiStatus="Error", exc=e)
+        recordStartupPhase(phaseName, phaseStartedAt)
+
+    warmupDoneEvent.set()
+    recordStartupPhase("warmed", processStartedAt)
+
+
+def buildProductionServer(threads: int, timeoutSeconds: int, keepAlive: bool):
+    from cheroot import wsgi
+
+    server = wsgi.Server(
+        (SERVER_HOST, SERVER_PORT),
+        app,
+        numthreads=threads,
+        timeout=timeoutSeconds,
+        shutdown_timeout=5,
+        server_name="GoodreadsRPC",
+    )
+    server.protocol = "HTTP/1.1" if keepAlive else "HTTP/1.0"
+    return server.prepare, server.serve, server.stop
+
+
+def buildDevelopmentServer():
+    from werkzeug.serving import make_server
+
+    server = make_server(SERVER_HOST, SERVER_PORT, app, threaded=True)
+    return (lambda: None), server.serve_forever, server.shutdown
+
+
+def stopServer() -> None:
+    serverStoppingEvent.set()
+    profileStopEvent.set()
+    flushConfigSave()
+    should_run_event.clear()
+    wakePresenceLoop()
+    publishEvent("shutdown", {})
+    storygraphBrowserPool.shutdown(timeoutSeconds=2)
+
+    with serverLock:
+        stopHook = serverStopHook
+
+    if stopHook is None:
+        os.kill(os.getpid(), signal.SIGTERM)
+        return
+
+    stopHook()
+
+
 def run():
+    global serverStopHook
+
+    phaseStartedAt = time.perf_counter()
+    initializeRuntimeState()
+    installConfigFlushHandlers()
+    recordStartupPhase("config", phaseStartedAt)
+
+    with configLock:
+        serverMode = (CONFIG.get("server_mode") or "production").lower()
+        threads = int(CONFIG.get("server_threads", 16))
+        timeoutSeconds = int(CONFIG.get("server_timeout_seconds", 30))
+        keepAlive = bool(CONFIG.get("server_keepalive", True))
+
     try:
-        logInfo("Flask server starting.", uiStatus="Info")
-        app.run(host="localhost", port=5000)
+        phaseStartedAt = time.perf_counter()
+        serve = None
+        if serverMode == "production":
+            try:
+                listen, serve, stopHook = buildProductionServer(threads, timeoutSeconds, keepAlive)
+            except ImportError as e:
+                logWarning(f"Production server unavailable ({e}); using the development server.", uiStatus="Info")
+                serverMode = "development"
+
+        if serve is None:
+            listen, serve, stopHook = buildDevelopmentServer()
+            threads, timeoutSeconds, keepAlive = None, None, None
+
+        with serverLock:
+            serverStopHook = stopHook
+            serverInfo.update(mode=serverMode, threads=threads, timeoutSeconds=timeoutSeconds, keepAlive=keepAlive)
+
+        listen()
+        recordStartupPhase("listen", phaseStartedAt)
+
+        threading.Thread(target=warmUpInBackground, daemon=True, name="WarmupThread").start()
+
+        logInfo(f"Flask server starting ({serverMode} mode).", uiStatus="Info")
+        serve()
+        logInfo("Flask server stopped.", uiStatus=None)
     except Exception as e:
         logError(f"Flask runtime error: {e}", uiStatus="Error", exc=e)
+    finally:
+        flushConfigSave()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,253 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+benchDir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(benchDir))
+sys.path.insert(0, benchDir)
+
+import app  # noqa: E402
+from synthetic_pages import buildCoverUrls, buildGoodreadsShelfPage, buildStoryGraphCurrentReadsPage  # noqa: E402
+
+BENCH_RESULTS_VERSION = 1
+DEFAULT_SIZES = [1, 20, 200, 5000]
+DEFAULT_RESULTS_PATH = os.path.join(benchDir, "results.json")
+DEFAULT_BASELINE_PATH = os.path.join(benchDir, "baseline.json")
+
+
+class StubResponse:
+    def __init__(self, url: str, text: str):
+        self.url = url
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = 200
+        self.reason = "OK"
+        self.headers = {}
+        self.history = []
+
+
+class StubHttpSession:
+    def __init__(self, text: str):
+        self.text = text
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        return StubResponse(url, self.text)
+
+
+def getRepeatCount(size: int) -> int:
+    return max(3, min(50, 2000 // max(1, size)))
+
+
+def timeCase(fn, repeats: int, setup=None) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        startedAt = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - startedAt)
+    return timings
+
+
+def summarizeTimings(timings: list[float], size: int, items: int) -> dict:
+    median = statistics.median(timings)
+    return {
+        "size": size,
+        "items": items,
+        "repeats": len(timings),
+        "minSeconds": min(timings),
+        "medianSeconds": median,
+        "meanSeconds": statistics.fmean(timings),
+        "microsPerItem": (median / items * 1_000_000) if items else None,
+    }
+
+
+def resetGoodreadsState(clearMemo: bool) -> None:
+    with app.scrapeValidatorsLock:
+        app.scrapeValidators.clear()
+    if clearMemo:
+        app.goodreadsRowMemo = app.RowMemo()
+
+
+def resetStoryGraphState(clearMemo: bool) -> None:
+    if clearMemo:
+        app.storygraphRowMemo = app.RowMemo()
+
+
+def benchGoodreadsGetBooks(size: int, repeats: int) -> dict:
+    app.httpSession = StubHttpSession(buildGoodreadsShelfPage(size))
+    app.CONFIG.update({"platform": "goodreads", "goodreads_id": "12345-bench"})
+
+    results = {}
+    for caseName, clearMemo in (("goodreads_get_books_cold", True), ("goodreads_get_books_warm", False)):
+        resetGoodreadsState(clearMemo=True)
+        if not clearMemo:
+            app.get_books()
+        found = {}
+
+        def run():
+            found["books"] = app.get_books() or {}
+
+        timings = timeCase(run, repeats, setup=lambda: resetGoodreadsState(clearMemo))
+        results[caseName] = summarizeTimings(timings, size, len(found["books"]))
+    return results
+
+
+def benchStoryGraph(size: int, repeats: int) -> dict:
+    htmlText = buildStoryGraphCurrentReadsPage(size)
+
+    results = {}
+    parsed = []
+    for caseName, clearMemo in (("storygraph_parse_cold", True), ("storygraph_parse_warm", False)):
+        resetStoryGraphState(clearMemo=True)
+        if not clearMemo:
+            app.parseStoryGraphCurrentReadsHtml(htmlText)
+
+        def run():
+            parsed[:] = app.parseStoryGraphCurrentReadsHtml(htmlText)
+
+        timings = timeCase(run, repeats, setup=lambda: resetStoryGraphState(clearMemo))
+        results[caseName] = summarizeTimings(timings, size, len(parsed))
+
+    normalized = {}
+
+    def runNormalize():
+        normalized["books"] = app.normalizeStorygraphBooksToDict(parsed)
+
+    timings = timeCase(runNormalize, repeats)
+    results["storygraph_normalize"] = summarizeTimings(timings, size, len(normalized["books"]))
+    return results
+
+
+def benchSanitizeCover(size: int, repeats: int) -> dict:
+    coverUrls = buildCoverUrls(size)
+
+    def run():
+        for coverUrl in coverUrls:
+            app.sanitizeCover(coverUrl)
+
+    timings = timeCase(run, repeats)
+    return {"sanitize_cover": summarizeTimings(timings, size, len(coverUrls))}
+
+
+def runBenchmarks(sizes: list[int]) -> dict:
+    app.logger.disabled = True
+    previousSession = app.httpSession
+    previousConfig = dict(app.CONFIG)
+
+    results = {}
+    try:
+        for size in sizes:
+            repeats = getRepeatCount(size)
+            for benchFn in (benchGoodreadsGetBooks, benchStoryGraph, benchSanitizeCover):
+                for caseName, summary in benchFn(size, repeats).items():
+                    results[f"{caseName}@{size}"] = summary
+    finally:
+        app.httpSession = previousSession
+        app.CONFIG.clear()
+        app.CONFIG.update(previousConfig)
+        app.logger.disabled = False
+
+    return {
+        "version": BENCH_RESULTS_VERSION,
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "htmlParser": app.getHtmlParserBackend(),
+        "results": results,
+    }
+
+
+def loadResults(path: str) -> dict | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    if not isinstance(data, dict) or data.get("version") != BENCH_RESULTS_VERSION:
+        print(f"Ignoring {path}: unsupported benchmark results version.")
+        return None
+    return data
+
+
+def writeResults(path: str, data: dict) -> None:
+    tmpPath = f"{path}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmpPath, path)
+
+
+def compareWithBaseline(current: dict, baseline: dict, tolerance: float, noiseFloorSeconds: float) -> list[dict]:
+    if baseline.get("htmlParser") != current.get("htmlParser"):
+        print(f"Warning: baseline used parser {baseline.get('htmlParser')!r}, this run used {current.get('htmlParser')!r}.")
+
+    rows = []
+    baselineResults = baseline.get("results") or {}
+    for caseKey, summary in current["results"].items():
+        previous = baselineResults.get(caseKey)
+        if not previous:
+            continue
+        before = previous["medianSeconds"]
+        after = summary["medianSeconds"]
+        ratio = (after / before) if before else None
+        regressed = ratio is not None and ratio > 1 + tolerance and (after - before) > noiseFloorSeconds
+        rows.append({"case": caseKey, "baseline": before, "current": after, "ratio": ratio, "regressed": regressed})
+    return rows
+
+
+def printSummary(current: dict, comparison: list[dict]) -> None:
+    comparisonByCase = {row["case"]: row for row in comparison}
+    print(f"{'case':<34} {'median ms':>11} {'us/item':>9} {'baseline ms':>12} {'ratio':>7}")
+    for caseKey, summary in current["results"].items():
+        row = comparisonByCase.get(caseKey)
+        baselineText = f"{row['baseline'] * 1000:.3f}" if row else "-"
+        ratioText = f"{row['ratio']:.2f}" if row and row["ratio"] is not None else "-"
+        flag = "  REGRESSED" if row and row["regressed"] else ""
+        perItem = summary["microsPerItem"]
+        perItemText = f"{perItem:.1f}" if perItem is not None else "-"
+        print(f"{caseKey:<34} {summary['medianSeconds'] * 1000:>11.3f} {perItemText:>9} {baselineText:>12} {ratioText:>7}{flag}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline parser benchmarks on synthetic Goodreads and StoryGraph shelves.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--output", default=DEFAULT_RESULTS_PATH)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs. baseline median (0.25 = 25%%).")
+    parser.add_argument("--noise-floor-ms", type=float, default=0.5, help="Ignore slowdowns smaller than this in absolute terms.")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    current = runBenchmarks(args.sizes)
+    writeResults(args.output, current)
+
+    baseline = loadResults(args.baseline)
+    comparison = []
+    if baseline and not args.update_baseline:
+        comparison = compareWithBaseline(current, baseline, args.tolerance, args.noise_floor_ms / 1000)
+        current["comparison"] = {"baseline": args.baseline, "tolerance": args.tolerance, "cases": comparison}
+        writeResults(args.output, current)
+
+    printSummary(current, comparison)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        baselineData = {key: value for key, value in current.items() if key != "comparison"}
+        writeResults(args.baseline, baselineData)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    regressions = [row for row in comparison if row["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed beyond {args.tolerance:.0%} of baseline.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+
+benchDir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(benchDir))
+sys.path.insert(0, benchDir)
+
+import app  # noqa: E402
+from fake_discord_ipc import OP_FRAME, OP_HANDSHAKE, FakeDiscordIpcServer  # noqa: E402
+
+PRESENCE_RESULTS_VERSION = 1
+DEFAULT_RESULTS_PATH = os.path.join(benchDir, "presence_results.json")
+BENCH_DISCORD_APP_ID = "100000000000000001"
+
+
+def buildBenchBook(index: int) -> dict:
+    return {
+        "isbn": f"bench-{index}",
+        "title": f"Bench Book {index}",
+        "author": f"Bench Author {index % 17}",
+        "coverArt": None,
+        "startDate": "Jan 5, 2024",
+        "platform": "goodreads",
+        "bookUrl": None,
+    }
+
+
+def setCurrentBook(book: dict) -> None:
+    app.swapBookSnapshot(lambda previous: ({**previous.books, book["isbn"]: book}, book["isbn"]))
+    app.wakePresenceLoop()
+
+
+def startPresenceLoop() -> threading.Thread:
+    app.should_run_event.set()
+    app.init_event.set()
+    presenceThread = threading.Thread(target=app.run_presence, daemon=True, name="PresenceThread")
+    presenceThread.start()
+    return presenceThread
+
+
+def stopPresenceLoop(presenceThread: threading.Thread, timeoutSeconds: float = 5.0) -> bool:
+    app.should_run_event.clear()
+    app.wakePresenceLoop()
+    presenceThread.join(timeout=timeoutSeconds)
+    return not presenceThread.is_alive()
+
+
+def isActivityFrame(record) -> bool:
+    return record.opcode == OP_FRAME and record.cmd == "SET_ACTIVITY"
+
+
+def getActivityDetails(record) -> str | None:
+    activity = ((record.payload.get("args") or {}).get("activity")) or {}
+    return activity.get("details")
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def runPhase(server: FakeDiscordIpcServer, phaseName: str, startIndex: int, updates: int, rate: float, settleSeconds: float) -> dict:
+    issued = []
+    interval = 1.0 / rate if rate > 0 else 0.0
+    frameCountBefore = len(server.getFrames())
+    nextAt = time.perf_counter()
+
+    for index in range(startIndex, startIndex + updates):
+        now = time.perf_counter()
+        if nextAt > now:
+            time.sleep(nextAt - now)
+        book = buildBenchBook(index)
+        issuedAt = time.perf_counter()
+        setCurrentBook(book)
+        issued.append((book["title"], issuedAt))
+        nextAt += interval
+
+    lastTitle = issued[-1][0]
+    server.waitForFrame(lambda record: isActivityFrame(record) and getActivityDetails(record) == lastTitle, settleSeconds)
+
+    firstSeenAt = {}
+    activityFrames = []
+    for record in server.getFrames()[frameCountBefore:]:
+        if not isActivityFrame(record):
+            continue
+        details = getActivityDetails(record)
+        if details is None:
+            continue
+        activityFrames.append(record)
+        firstSeenAt.setdefault(details, record.receivedAt)
+
+    latencies = []
+    delivered = 0
+    coalesced = 0
+    dropped = 0
+    latestDeliveredPosition = -1
+    for position, (title, _) in enumerate(issued):
+        if title in firstSeenAt:
+            latestDeliveredPosition = position
+    for position, (title, issuedAt) in enumerate(issued):
+        if title in firstSeenAt:
+            delivered += 1
+            latencies.append(firstSeenAt[title] - issuedAt)
+        elif position < latestDeliveredPosition:
+            coalesced += 1
+        else:
+            dropped += 1
+
+    payloadSizes = [record.size for record in activityFrames]
+    return {
+        "phase": phaseName,
+        "issued": len(issued),
+        "delivered": delivered,
+        "coalesced": coalesced,
+        "dropped": dropped,
+        "activityFrames": len(activityFrames),
+        "latencyMs": {
+            "p50": (percentile(latencies, 0.50) or 0.0) * 1000 if latencies else None,
+            "p95": (percentile(latencies, 0.95) or 0.0) * 1000 if latencies else None,
+            "max": max(latencies) * 1000 if latencies else None,
+        },
+        "payloadBytes": {
+            "min": min(payloadSizes) if payloadSizes else None,
+            "mean": statistics.fmean(payloadSizes) if payloadSizes else None,
+            "max": max(payloadSizes) if payloadSizes else None,
+        },
+    }
+
+
+def runRejectPhase(server: FakeDiscordIpcServer, startIndex: int, updates: int, rate: float, durationSeconds: float) -> dict:
+    # Discord refusing the payload must not look like a dropped pipe: the loop should keep its
+    # socket instead of reconnecting and replaying the same activity over and over.
+    server.rejectActivities = True
+    serverBefore = server.getStats()
+    connectionBefore = app.discordConnection.getStats()
+    frameCountBefore = len(server.getFrames())
+    startedAt = time.perf_counter()
+    try:
+        interval = 1.0 / rate if rate > 0 else 0.0
+        for index in range(startIndex, startIndex + updates):
+            setCurrentBook(buildBenchBook(index))
+            time.sleep(interval)
+        remaining = durationSeconds - (time.perf_counter() - startedAt)
+        if remaining > 0:
+            time.sleep(remaining)
+    finally:
+        server.rejectActivities = False
+
+    serverAfter = server.getStats()
+    connectionAfter = app.discordConnection.getStats()
+    return {
+        "phase": "rejecting",
+        "issued": updates,
+        "seconds": round(time.perf_counter() - startedAt, 2),
+        "activityFrames": sum(1 for record in server.getFrames()[frameCountBefore:] if isActivityFrame(record)),
+        "serverRejected": serverAfter["rejected"] - serverBefore["rejected"],
+        "handshakes": serverAfter["handshakes"] - serverBefore["handshakes"],
+        "reconnects": connectionAfter["reconnects"] - connectionBefore["reconnects"],
+        "rejected": connectionAfter.get("rejected", 0) - connectionBefore.get("rejected", 0),
+        "stillConnected": connectionAfter["connected"],
+    }
+
+
+def runPresenceHarness(updates: int, rate: float, reconnects: int, settleSeconds: float, responseDelaySeconds: float, rejectSeconds: float = 0.0) -> dict:
+    server = FakeDiscordIpcServer(responseDelaySeconds=responseDelaySeconds).start()
+    previousRuntimeDir = os.environ.get("XDG_RUNTIME_DIR")
+    os.environ["XDG_RUNTIME_DIR"] = server.socketDir
+
+    app.logger.disabled = True
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+    with app.configLock:
+        previousConfig = dict(app.CONFIG)
+        app.CONFIG.update({
+            "platform": "goodreads",
+            "goodreads_id": "12345-bench",
+            "discord_app_id": BENCH_DISCORD_APP_ID,
+            "update_interval": 60,
+            "presence_keepalive_seconds": 0,
+        })
+    statsBefore = app.getPresenceStats()
+
+    phases = []
+    rejecting = None
+    presenceThread = None
+    stoppedCleanly = None
+    try:
+        setCurrentBook(buildBenchBook(0))
+        presenceThread = startPresenceLoop()
+        if not server.waitForFrame(lambda record: record.opcode == OP_HANDSHAKE, settleSeconds):
+            raise RuntimeError("Presence loop never completed the Discord handshake.")
+
+        nextIndex = 1
+        phases.append(runPhase(server, "steady", nextIndex, updates, rate, settleSeconds))
+        nextIndex += updates
+
+        for reconnectRound in range(1, reconnects + 1):
+            server.dropConnections()
+            phases.append(runPhase(server, f"afterDrop{reconnectRound}", nextIndex, updates, rate, settleSeconds))
+            nextIndex += updates
+
+        if rejectSeconds > 0:
+            rejecting = runRejectPhase(server, nextIndex, min(updates, 5), rate, rejectSeconds)
+    finally:
+        if presenceThread is not None:
+            stoppedCleanly = stopPresenceLoop(presenceThread)
+        server.stop()
+        with app.configLock:
+            app.CONFIG.clear()
+            app.CONFIG.update(previousConfig)
+        if previousRuntimeDir is None:
+            os.environ.pop("XDG_RUNTIME_DIR", None)
+        else:
+            os.environ["XDG_RUNTIME_DIR"] = previousRuntimeDir
+        app.logger.disabled = False
+
+    statsAfter = app.getPresenceStats()
+    return {
+        "version": PRESENCE_RESULTS_VERSION,
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "settings": {
+            "updates": updates,
+            "rate": rate,
+            "reconnects": reconnects,
+            "settleSeconds": settleSeconds,
+            "responseDelayMs": responseDelaySeconds * 1000,
+            "rejectSeconds": rejectSeconds,
+        },
+        "phases": phases,
+        "rejecting": rejecting,
+        "server": server.getStats(),
+        "presenceStats": {key: statsAfter[key] - statsBefore.get(key, 0) for key in statsAfter},
+        "stoppedCleanly": stoppedCleanly,
+    }
+
+
+def printSummary(results: dict) -> None:
+    print(f"{'phase':<12} {'issued':>7} {'deliv':>6} {'coal':>6} {'drop':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'bytes':>7}")
+    for phase in results["phases"]:
+        latency = phase["latencyMs"]
+        sizes = phase["payloadBytes"]
+
+        def fmt(value, spec=".2f"):
+            return "-" if value is None else format(value, spec)
+
+        print(
+            f"{phase['phase']:<12} {phase['issued']:>7} {phase['delivered']:>6} {phase['coalesced']:>6} {phase['dropped']:>6} "
+            f"{fmt(latency['p50']):>8} {fmt(latency['p95']):>8} {fmt(latency['max']):>8} {fmt(sizes['mean'], '.0f'):>7}"
+        )
+    if results.get("rejecting"):
+        print(f"rejecting: {json.dumps(results['rejecting'])}")
+    print(f"server: {json.dumps(results['server'])}")
+    print(f"presence: {json.dumps(results['presenceStats'])}")
+
+
+def main() -> int:
+    if sys.platform == "win32":
+        print("The presence harness needs Unix sockets; run it on Linux or macOS.")
+        return 1
+
+    parser = argparse.ArgumentParser(description="Drive run_presence() against a fake Discord IPC socket.")
+    parser.add_argument("--updates", type=int, default=200, help="Book changes per phase.")
+    parser.add_argument("--rate", type=float, default=50.0, help="Book changes per second.")
+    parser.add_argument("--reconnects", type=int, default=1, help="Times the fake Discord drops the connection.")
+    parser.add_argument("--settle-seconds", type=float, default=3.0)
+    parser.add_argument("--response-delay-ms", type=float, default=0.0)
+    parser.add_argument("--reject-seconds", type=float, default=5.0, help="How long the fake Discord rejects every activity at the end (0 to skip).")
+    parser.add_argument("--max-reject-handshakes", type=int, default=1, help="Exit non-zero if the rejecting phase reconnects more often than this.")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_PATH)
+    parser.add_argument("--max-dropped", type=int, default=None, help="Exit non-zero if any phase drops more updates than this.")
+    args = parser.parse_args()
+
+    results = runPresenceHarness(args.updates, args.rate, args.reconnects, args.settle_seconds, args.response_delay_ms / 1000, args.reject_seconds)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    printSummary(results)
+    print(f"Results written to {args.output}")
+
+    if args.max_dropped is not None and any(phase["dropped"] > args.max_dropped for phase in results["phases"]):
+        return 1
+    if results["rejecting"] and results["rejecting"]["handshakes"] > args.max_reject_handshakes:
+        print(f"Rejected activities caused {results['rejecting']['handshakes']} handshake(s); expected at most {args.max_reject_handshakes}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import sys
+
+benchDir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(benchDir))
+sys.path.insert(0, benchDir)
+
+import app  # noqa: E402
+from synthetic_pages import buildGoodreadsShelfPage, buildStoryGraphCurrentReadsPage  # noqa: E402
+
+FIXTURES_DIR = os.path.join(benchDir, "fixtures")
+GOODREADS_FIXTURES = ["goodreads_shelf", "goodreads_tr_in_comment", "goodreads_omitted_tr_end", "goodreads_gt_in_attribute"]
+STORYGRAPH_FIXTURES = ["storygraph_panes", "storygraph_comment_in_pane"]
+GOODREADS_FIXTURE_BOOK_URL = "https://www.goodreads.com/review/list/12345-fixture?shelf=currently-reading"
+DEFAULT_SIZES = [1, 20, 300]
+
+
+def parseGoodreadsReference(htmlText: str, bookUrl: str) -> list[dict] | None:
+    # The original full-document html.parser loop, kept verbatim as the source of truth.
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(htmlText, "html.parser")
+    bookTable = soup.find("table", {"id": "books"})
+    if not bookTable:
+        return None
+
+    books = []
+    for row in bookTable.find_all("tr", {"id": lambda x: x and x.startswith("review_")}):
+        titleCell = row.find("td", class_="field title")
+        authorCell = row.find("td", class_="field author")
+        coverCell = row.find("td", class_="field cover")
+        dateCell = row.find("td", class_="field date_started")
+        isbnCell = row.find("td", class_="field isbn")
+
+        title = app.safeText(titleCell.find("a") if titleCell else None) or "Unknown Title"
+        author = app.safeText(authorCell.find("a") if authorCell else None) or "Unknown Author"
+        coverArt = app.sanitizeCover(coverCell.find("img")["src"] if coverCell and coverCell.find("img") else None)
+
+        startSpan = dateCell.find("span", class_="date_started_value") if dateCell else None
+        startDate = app.safeText(startSpan)
+
+        isbnVal = None
+        if isbnCell:
+            txt = app.safeText(isbnCell.find("div", class_="value"))
+            if txt:
+                isbnVal = txt
+
+        isbn = isbnVal if isbnVal else f"noisbn-{title}-{author}"
+        books.append({
+            "isbn": isbn,
+            "title": title,
+            "author": author,
+            "coverArt": coverArt,
+            "startDate": startDate,
+            "platform": "goodreads",
+            "bookUrl": bookUrl,
+        })
+    return books
+
+
+def getAvailableBuilders() -> list[str]:
+    builders = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        builders.append("lxml")
+    return builders
+
+
+def parseWithBuilder(htmlText: str, bookUrl: str, builder: str) -> list[dict] | None:
+    rows = app.findGoodreadsReviewRows(htmlText, builder)
+    if rows is None:
+        return None
+    return [app.parseGoodreadsRow(row, bookUrl) for row in rows]
+
+
+def parseWithShelf(htmlText: str, bookUrl: str) -> tuple[list[dict], list[dict]]:
+    app.goodreadsRowMemo = app.RowMemo()
+    _, cold = app.parseGoodreadsShelf(htmlText, bookUrl)
+    _, warm = app.parseGoodreadsShelf(htmlText, bookUrl)
+    return cold, warm
+
+
+def compareBooks(label: str, expected: list[dict] | None, actual: list[dict] | None) -> list[str]:
+    if expected == actual:
+        return []
+    if expected is None or actual is None:
+        return [f"{label}: expected {expected!r}, got {actual!r}"]
+    if len(expected) != len(actual):
+        return [f"{label}: expected {len(expected)} book(s), got {len(actual)}"]
+
+    problems = []
+    for index, (expectedBook, actualBook) in enumerate(zip(expected, actual)):
+        for field in sorted(set(expectedBook) | set(actualBook)):
+            if expectedBook.get(field) != actualBook.get(field):
+                problems.append(f"{label}: row {index} {field}: expected {expectedBook.get(field)!r}, got {actualBook.get(field)!r}")
+    return problems
+
+
+def checkAgainstReference(label: str, htmlText: str, bookUrl: str, expected: list[dict] | None) -> list[str]:
+    problems = []
+    for builder in getAvailableBuilders():
+        problems += compareBooks(f"{label} [{builder}]", expected, parseWithBuilder(htmlText, bookUrl, builder))
+
+    cold, warm = parseWithShelf(htmlText, bookUrl)
+    problems += compareBooks(f"{label} [parseGoodreadsShelf cold]", expected or [], cold)
+    problems += compareBooks(f"{label} [parseGoodreadsShelf warm]", expected or [], warm)
+    return problems
+
+
+def checkFixtures(updateExpected: bool) -> list[str]:
+    problems = []
+    for fixtureName in GOODREADS_FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, f"{fixtureName}.html"), "r", encoding="utf-8") as f:
+            htmlText = f.read()
+        expectedPath = os.path.join(FIXTURES_DIR, f"{fixtureName}_expected.json")
+
+        reference = parseGoodreadsReference(htmlText, GOODREADS_FIXTURE_BOOK_URL)
+        if updateExpected:
+            with open(expectedPath, "w", encoding="utf-8") as f:
+                json.dump(reference, f, indent=2)
+                f.write("\n")
+            print(f"Expected output updated at {expectedPath}")
+
+        with open(expectedPath, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+
+        problems += compareBooks(f"{fixtureName} [reference]", expected, reference)
+        problems += checkAgainstReference(fixtureName, htmlText, GOODREADS_FIXTURE_BOOK_URL, expected)
+    return problems
+
+
+def checkSynthetic(sizes: list[int]) -> list[str]:
+    problems = []
+    for size in sizes:
+        htmlText = buildGoodreadsShelfPage(size)
+        reference = parseGoodreadsReference(htmlText, GOODREADS_FIXTURE_BOOK_URL)
+        problems += checkAgainstReference(f"synthetic@{size}", htmlText, GOODREADS_FIXTURE_BOOK_URL, reference)
+    return problems
+
+
+def parseStoryGraphReference(htmlText: str) -> list[dict]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(htmlText, "html.parser")
+    return [app.parseStoryGraphBookPane(bookPane) for bookPane in soup.select("div.book-pane[data-book-id]")]
+
+
+def checkStoryGraph(sizes: list[int]) -> list[str]:
+    pages = []
+    for fixtureName in STORYGRAPH_FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, f"{fixtureName}.html"), "r", encoding="utf-8") as f:
+            pages.append((fixtureName, f.read()))
+    pages += [(f"storygraph_synthetic@{size}", buildStoryGraphCurrentReadsPage(size)) for size in sizes]
+
+    problems = []
+    for label, htmlText in pages:
+        reference = parseStoryGraphReference(htmlText)
+        app.storygraphRowMemo = app.RowMemo()
+        problems += compareBooks(f"{label} [cold]", reference, app.parseStoryGraphCurrentReadsHtml(htmlText))
+        problems += compareBooks(f"{label} [warm]", reference, app.parseStoryGraphCurrentReadsHtml(htmlText))
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the Goodreads and StoryGraph parsers against the original html.parser output.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--update-expected", action="store_true", help="Rewrite fixture expectations from the reference parser.")
+    args = parser.parse_args()
+
+    app.logger.disabled = True
+    try:
+        problems = checkFixtures(args.update_expected) + checkSynthetic(args.sizes) + checkStoryGraph(args.sizes)
+    finally:
+        app.logger.disabled = False
+
+    for problem in problems:
+        print(problem)
+    if problems:
+        print(f"{len(problems)} mismatch(es) against the reference parser.")
+        return 1
+
+    fixtureCount = len(GOODREADS_FIXTURES) + len(STORYGRAPH_FIXTURES)
+    print(f"Parsers match the reference on {fixtureCount} fixture(s) and sizes {args.sizes} ({', '.join(getAvailableBuilders())}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+import argparse
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+OP_HANDSHAKE = 0
+OP_FRAME = 1
+OP_CLOSE = 2
+OP_PING = 3
+OP_PONG = 4
+
+FrameRecord = namedtuple("FrameRecord", "connectionId receivedAt wallTime opcode cmd nonce size payload")
+
+
+def recvExact(conn: socket.socket, size: int) -> bytes | None:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = conn.recv(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def encodeFrame(opcode: int, payload: dict) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    return struct.pack("<II", opcode, len(body)) + body
+
+
+# Stand-in for the Discord client's RPC socket: speaks the 8-byte (opcode, length)
+# framing, answers handshakes and commands, and records every frame it receives.
+class FakeDiscordIpcServer:
+    def __init__(self, socketDir: str | None = None, pipeIndex: int = 0, responseDelaySeconds: float = 0.0, rejectActivities: bool = False):
+        self.socketDir = socketDir or tempfile.mkdtemp(prefix="fake-discord-ipc-")
+        self.socketPath = os.path.join(self.socketDir, f"discord-ipc-{pipeIndex}")
+        self.responseDelaySeconds = responseDelaySeconds
+        self.rejectActivities = rejectActivities
+        self.lock = threading.Lock()
+        self.frames = []
+        self.connections = {}
+        self.stats = {"connections": 0, "probes": 0, "handshakes": 0, "closes": 0, "dropped": 0, "rejected": 0}
+        self.frameEvent = threading.Condition(self.lock)
+        self.listener = None
+        self.acceptThread = None
+        self.stopping = threading.Event()
+        self.nextConnectionId = 0
+
+    def start(self) -> "FakeDiscordIpcServer":
+        if os.path.exists(self.socketPath):
+            os.unlink(self.socketPath)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.socketPath)
+        self.listener.listen(16)
+        self.acceptThread = threading.Thread(target=self.acceptLoop, daemon=True, name="FakeDiscordIpcAccept")
+        self.acceptThread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopping.set()
+        try:
+            self.listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self.listener.close()
+        except Exception:
+            pass
+        self.dropConnections(countAsDropped=False)
+        if self.acceptThread:
+            self.acceptThread.join(timeout=2)
+        try:
+            os.unlink(self.socketPath)
+        except FileNotFoundError:
+            pass
+
+    def dropConnections(self, countAsDropped: bool = True) -> int:
+        with self.lock:
+            conns = list(self.connections.values())
+            self.connections.clear()
+            if countAsDropped:
+                self.stats["dropped"] += len(conns)
+        for conn in conns:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+        return len(conns)
+
+    def acceptLoop(self) -> None:
+        while not self.stopping.is_set():
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.nextConnectionId += 1
+                connectionId = self.nextConnectionId
+                self.connections[connectionId] = conn
+                self.stats["connections"] += 1
+            threading.Thread(
+                target=self.connectionLoop,
+                args=(connectionId, conn),
+                daemon=True,
+                name=f"FakeDiscordIpcConn-{connectionId}",
+            ).start()
+
+    def recordFrame(self, connectionId: int, opcode: int, body: bytes) -> dict:
+        receivedAt = time.perf_counter()
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except Exception:
+            payload = {"raw": body.decode("utf-8", "replace")}
+
+        record = FrameRecord(
+            connectionId,
+            receivedAt,
+            time.time(),
+            opcode,
+            payload.get("cmd"),
+            payload.get("nonce"),
+            len(body),
+            payload,
+        )
+        with self.lock:
+            self.frames.append(record)
+            if opcode == OP_HANDSHAKE:
+                self.stats["handshakes"] += 1
+            elif opcode == OP_CLOSE:
+                self.stats["closes"] += 1
+            self.frameEvent.notify_all()
+        return payload
+
+    def buildReply(self, opcode: int, payload: dict) -> tuple[int, dict] | None:
+        if opcode == OP_HANDSHAKE:
+            return OP_FRAME, {
+                "cmd": "DISPATCH",
+                "evt": "READY",
+                "nonce": None,
+                "data": {
+                    "v": 1,
+                    "config": {"cdn_host": "cdn.discordapp.com", "api_endpoint": "//discord.com/api", "environment": "production"},
+                    "user": {"id": "0", "username": "fake-discord", "discriminator": "0", "avatar": None},
+                },
+            }
+        if opcode == OP_FRAME and payload.get("cmd") == "SET_ACTIVITY" and self.rejectActivities:
+            with self.lock:
+                self.stats["rejected"] += 1
+            # What Discord answers when it refuses the activity payload; the socket stays open.
+            return OP_FRAME, {
+                "cmd": "SET_ACTIVITY",
+                "evt": "ERROR",
+                "nonce": payload.get("nonce"),
+                "data": {"code": 4000, "message": 'child "activity" fails because [child "details" fails because ["details" length must be less than or equal to 128 characters long]]'},
+            }
+        if opcode == OP_FRAME:
+            args = payload.get("args") or {}
+            return OP_FRAME, {"cmd": payload.get("cmd"), "evt": None, "nonce": payload.get("nonce"), "data": args.get("activity")}
+        if opcode == OP_PING:
+            return OP_PONG, payload
+        return None
+
+    def connectionLoop(self, connectionId: int, conn: socket.socket) -> None:
+        sawFrame = False
+        try:
+            while not self.stopping.is_set():
+                header = recvExact(conn, 8)
+                if header is None:
+                    return
+                opcode, length = struct.unpack("<II", header)
+                body = recvExact(conn, length)
+                if body is None:
+                    return
+
+                sawFrame = True
+                payload = self.recordFrame(connectionId, opcode, body)
+                if opcode == OP_CLOSE:
+                    return
+
+                reply = self.buildReply(opcode, payload)
+                if reply is None:
+                    continue
+                if self.responseDelaySeconds > 0:
+                    time.sleep(self.responseDelaySeconds)
+                conn.sendall(encodeFrame(*reply))
+        except OSError:
+            return
+        finally:
+            with self.lock:
+                self.connections.pop(connectionId, None)
+                if not sawFrame:
+                    self.stats["probes"] += 1
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def waitForFrame(self, predicate, timeoutSeconds: float) -> FrameRecord | None:
+        deadline = time.perf_counter() + timeoutSeconds
+        with self.lock:
+            while True:
+                for record in reversed(self.frames):
+                    if predicate(record):
+                        return record
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self.frameEvent.wait(timeout=remaining)
+
+    def getFrames(self) -> list[FrameRecord]:
+        with self.lock:
+            return list(self.frames)
+
+    def getStats(self) -> dict:
+        with self.lock:
+            data = dict(self.stats)
+            data["frames"] = len(self.frames)
+            data["openConnections"] = len(self.connections)
+        return data
+
+    def dumpFrames(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.getFrames():
+                f.write(json.dumps(record._asdict()) + "\n")
+
+
+def main() -> int:
+    if sys.platform == "win32":
+        print("The fake Discord IPC server only supports Unix sockets.")
+        return 1
+
+    parser = argparse.ArgumentParser(description="Run a fake Discord RPC IPC socket that records frames.")
+    parser.add_argument("--dir", default=None, help="Directory for the discord-ipc-0 socket (point XDG_RUNTIME_DIR here).")
+    parser.add_argument("--record", default=None, help="Write received frames as JSON lines to this path on exit.")
+    parser.add_argument("--response-delay-ms", type=float, default=0.0)
+    parser.add_argument("--reject-activity", action="store_true", help="Answer every SET_ACTIVITY with an ERROR event, like Discord does for invalid payloads.")
+    args = parser.parse_args()
+
+    server = FakeDiscordIpcServer(args.dir, responseDelaySeconds=args.response_delay_ms / 1000, rejectActivities=args.reject_activity).start()
+    print(f"Listening on {server.socketPath}")
+    print(f"Run the backend with XDG_RUNTIME_DIR={server.socketDir}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        if args.record:
+            server.dumpFrames(args.record)
+            print(f"Recorded {len(server.getFrames())} frame(s) to {args.record}")
+        print(json.dumps(server.getStats()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import random
+
+GOODREADS_PAGE_HEAD = """<!DOCTYPE html>
+<html class="desktop">
+<head>
+<title>Currently Reading | Goodreads</title>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://s.gr-assets.com/assets/goodreads.css">
+<script src="https://s.gr-assets.com/assets/goodreads.js"></script>
+</head>
+<body>
+<div class="siteHeader">
+  <nav class="siteHeader__primaryNavInline">
+    <ul>{navItems}</ul>
+  </nav>
+</div>
+<div class="mainContentContainer">
+<div class="mainContent">
+<div id="leftCol" class="leftCol">
+  <div id="shelvesSection">{shelfLinks}</div>
+</div>
+<div id="rightCol">
+<table id="books" class="table stacked" border="0">
+<thead>
+<tr id="booksHeader" class="tableList">
+  <th class="header field checkbox"></th>
+  <th class="header field cover"><a href="#">cover</a></th>
+  <th class="header field title"><a href="#">title</a></th>
+  <th class="header field author"><a href="#">author</a></th>
+  <th class="header field isbn"><a href="#">isbn</a></th>
+  <th class="header field date_started"><a href="#">date started</a></th>
+</tr>
+</thead>
+<tbody id="booksBody">
+"""
+
+GOODREADS_PAGE_TAIL = """</tbody>
+</table>
+<div id="reviewPagination"><em class="current">1</em></div>
+</div>
+</div>
+</div>
+<footer class="responsiveSiteFooter">{footerLinks}</footer>
+</body>
+</html>
+"""
+
+GOODREADS_ROW = """<tr id="review_{reviewId}" class="bookalike review">
+  <td class="field checkbox"><label>checkbox</label><div class="value"><input type="checkbox" name="reviews[{reviewId}]" value="1"></div></td>
+  <td class="field position" style="display: none"><label>position</label><div class="value">{position}</div></td>
+  <td class="field cover"><label>cover</label><div class="value"><div class="js-tooltipTrigger tooltipTrigger" data-resource-type="Book" data-resource-id="{bookId}"><a href="/book/show/{bookId}">{coverImg}</a></div></div></td>
+  <td class="field title"><label>title</label><div class="value"><a title="{title}" href="/book/show/{bookId}">
+        {title}
+        <span class="darkGreyText">({series}, #{seriesNumber})</span>
+</a></div></td>
+  <td class="field author"><label>author</label><div class="value"><a href="/author/show/{authorId}">{author}</a></div></td>
+  <td class="field isbn"><label>isbn</label><div class="value">
+        {isbn}
+      </div></td>
+  <td class="field num_pages" style="display: none"><label>num pages</label><div class="value"><nobr>{pages} <span class="greyText">pp</span></nobr></div></td>
+  <td class="field avg_rating"><label>avg rating</label><div class="value">{avgRating}</div></td>
+  <td class="field rating"><label>Reviewer rating</label><div class="value"><div class="stars" data-resource-id="{bookId}" data-user-id="1" data-rating="0"></div></div></td>
+  <td class="field date_started"><label>date started</label><div class="value"><div class="editable_date date_started_{reviewId}">{dateStarted}</div></div></td>
+  <td class="field actions"><label>actions</label><div class="value"><div class="actionsWrapper greyText smallText"><a class="actionLinkLite" href="/review/edit/{bookId}">edit</a></div></div></td>
+</tr>
+"""
+
+STORYGRAPH_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<title>Currently Reading | The StoryGraph</title>
+<meta name="turbo-cache-control" content="no-preview">
+<link rel="stylesheet" href="/assets/application.css">
+<script src="/assets/application.js" defer></script>
+</head>
+<body class="bg-grey-50">
+<nav class="navbar">{navItems}</nav>
+<main class="max-w-6xl mx-auto">
+<h2 class="font-semibold">Currently Reading ({bookCount})</h2>
+<div class="read-books-panes">
+"""
+
+STORYGRAPH_PAGE_TAIL = """</div>
+</main>
+<footer class="footer">{footerLinks}</footer>
+</body>
+</html>
+"""
+
+STORYGRAPH_PANE = """<div class="book-pane break-inside-avoid-column" data-book-id="{bookId}">
+  <div class="book-pane-content grid grid-cols-10 gap-5 p-3">
+    <div class="cover-image-column col-span-3">
+      <div class="book-cover"><a href="/books/{bookId}"><img alt="{title}" class="rounded-sm shadow-lg" src="{coverUrl}"></a></div>
+    </div>
+    <div class="book-title-author-and-series col-span-7">
+      <h3 class="font-bold text-xl">
+        <a href="/books/{bookId}">{title}</a>
+      </h3>
+      <p class="font-body mb-1">
+        <a href="/series/{seriesId}">{series}</a>
+        <a href="/series/{seriesId}">#{seriesNumber}</a>
+      </p>
+      <p class="font-body mb-1"><a class="hover:text-cyan-700" href="/authors/{authorId}">{author}</a></p>
+      <div class="progress-tracker-pane">
+        <div class="progress-bar"><div class="bg-cyan-700" style="width: {progress}%"></div></div>
+        <p class="text-xs">{progress}%</p>
+      </div>
+      <p class="text-xs text-darkestGrey">Started {dateStarted}</p>
+      <div class="tags-row"><span class="tag">{moodA}</span><span class="tag">{moodB}</span><span class="tag">{pace}</span></div>
+    </div>
+  </div>
+</div>
+"""
+
+TITLE_WORDS = ["Silent", "Winter", "House", "River", "Glass", "Empire", "Night", "Garden", "Iron", "Echo", "Crown", "Salt", "Library", "Storm", "Paper", "Orchard"]
+NAME_WORDS = ["Ada", "Bruno", "Chen", "Dara", "Elif", "Farah", "Goran", "Hana", "Ivo", "Juno", "Kiri", "Lena", "Mateo", "Noor", "Oskar", "Priya"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+MOODS = ["adventurous", "dark", "emotional", "funny", "hopeful", "mysterious", "reflective", "tense"]
+PACES = ["slow-paced", "medium-paced", "fast-paced"]
+
+
+def makeTitle(rng: random.Random) -> str:
+    return " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(2, 5)))
+
+
+def makeName(rng: random.Random) -> str:
+    return f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)}son"
+
+
+def makeDate(rng: random.Random) -> str:
+    return f"{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2015, 2025)}"
+
+
+def makeLinks(rng: random.Random, count: int, prefix: str) -> str:
+    return "".join(f'<li><a href="/{prefix}/{i}">{makeTitle(rng)}</a></li>' for i in range(count))
+
+
+def buildGoodreadsShelfPage(bookCount: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(bookCount):
+        bookId = 1_000_000 + index
+        hasCover = rng.random() > 0.05
+        hasIsbn = rng.random() > 0.15
+        hasStart = rng.random() > 0.2
+        rows.append(
+            GOODREADS_ROW.format(
+                reviewId=5_000_000_000 + index,
+                position=index + 1,
+                bookId=bookId,
+                coverImg=(
+                    f'<img alt="cover" src="https://i.gr-assets.com/images/S/compressed.photo.goodreads.com/books/{bookId}i/{bookId}._SY75_.jpg">'
+                    if hasCover
+                    else ""
+                ),
+                title=makeTitle(rng).replace("&", "&amp;"),
+                series=makeTitle(rng),
+                seriesNumber=rng.randint(1, 9),
+                authorId=rng.randint(1, 99_999),
+                author=makeName(rng),
+                isbn=f"{rng.randint(0, 9_999_999_999):010d}" if hasIsbn else "",
+                pages=rng.randint(90, 1200),
+                avgRating=f"{rng.uniform(2.5, 4.9):.2f}",
+                dateStarted=(
+                    f'<span class="date_started_value">{makeDate(rng)}</span>'
+                    if hasStart
+                    else '<span class="greyText">not set</span>'
+                ),
+            )
+        )
+
+    head = GOODREADS_PAGE_HEAD.format(navItems=makeLinks(rng, 12, "nav"), shelfLinks=makeLinks(rng, 20, "shelf"))
+    tail = GOODREADS_PAGE_TAIL.format(footerLinks=makeLinks(rng, 30, "footer"))
+    return head + "".join(rows) + tail
+
+
+def buildStoryGraphCurrentReadsPage(bookCount: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    panes = []
+    for index in range(bookCount):
+        bookId = f"{rng.getrandbits(64):016x}-{index}"
+        panes.append(
+            STORYGRAPH_PANE.format(
+                bookId=bookId,
+                title=makeTitle(rng).replace("&", "&amp;"),
+                coverUrl=f"https://cdn.thestorygraph.com/{bookId}._SX318_.jpg",
+                seriesId=rng.randint(1, 50_000),
+                series=makeTitle(rng),
+                seriesNumber=rng.randint(1, 9),
+                authorId=rng.randint(1, 99_999),
+                author=makeName(rng),
+                progress=rng.randint(0, 100),
+                dateStarted=makeDate(rng),
+                moodA=rng.choice(MOODS),
+                moodB=rng.choice(MOODS),
+                pace=rng.choice(PACES),
+            )
+        )
+
+    head = STORYGRAPH_PAGE_HEAD.format(navItems=makeLinks(rng, 10, "nav"), bookCount=bookCount)
+    tail = STORYGRAPH_PAGE_TAIL.format(footerLinks=makeLinks(rng, 20, "footer"))
+    return head + "".join(panes) + tail
+
+
+def buildCoverUrls(count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    suffixes = ["._SY75_.jpg", "._SX50_.jpg", "._SY160_.png", ".jpg", "._SX318_SY475_.jpeg"]
+    return [
+        f"https://i.gr-assets.com/images/S/compressed.photo.goodreads.com/books/{rng.randint(1, 10**9)}i/{index}{rng.choice(suffixes)}"
+        for index in range(count)
+    ]
@@ -279,16 +279,16 @@ function launchBackendOnce(launcher, binaryPath, args) {
     });
 }
 
-function waitForFlask(retries = 75) {
+function waitForFlask(retries = 190) {
     return new Promise((resolve, reject) => {
         const tryOnce = () => {
             http.get('http://localhost:5000/api/hello', (res) => {
                 if (res.statusCode === 200) return resolve();
                 if (--retries <= 0) return reject(new Error(`Flask responded with ${res.statusCode}`));
-                setTimeout(tryOnce, 250);
+                setTimeout(tryOnce, 100);
             }).on('error', () => {
                 if (--retries <= 0) return reject(new Error('Flask failed to respond'));
-                setTimeout(tryOnce, 250);
+                setTimeout(tryOnce, 100);
             });
         };
         tryOnce();
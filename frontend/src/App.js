@@ -12,6 +12,9 @@ function App() {
 
   const intervalRef = useRef(null);
   const messageTimer = useRef(null);
+  const eventStreamConnected = useRef(false);
+  const statusCursor = useRef(0);
+  const booksVersion = useRef(0);
 
   const showMessage = useCallback((msg) => {
     setMessage(msg);
@@ -19,10 +22,41 @@ function App() {
     messageTimer.current = setTimeout(() => setMessage(''), 2500);
   }, []);
 
+  const applyStatusEvents = useCallback((events) => {
+    if (events.length === 0) return;
+
+    const priority = { error: 3, active: 2, info: 1, idle: 0 };
+
+    const current = [...events].reduce((best, ev) => {
+      const bestScore = priority[(best.level || '').toLowerCase()] ?? 0;
+      const evScore = priority[(ev.level || '').toLowerCase()] ?? 0;
+
+      if (evScore > bestScore) return ev;
+      if (evScore === bestScore) {
+        const bestTs = best.ts ?? 0;
+        const evTs = ev.ts ?? 0;
+        if (evTs >= bestTs) return ev;
+      }
+      return best;
+    }, events[0]);
+
+    setStatus((prev) => {
+      const next = {
+        level: current.level || 'Idle',
+        text: current.text || '',
+        ts: current.ts || Date.now() / 1000,
+      };
+      if (prev.level === next.level && prev.text === next.text) return prev;
+      return next;
+    });
+  }, []);
+
   const fetchStatus = useCallback(() => {
-    fetch(`${apiBaseUrl}/api/status`)
+    fetch(`${apiBaseUrl}/api/status?since=${statusCursor.current}`)
       .then((res) => res.json())
       .then((data) => {
+        if (typeof data?.nextSeq === 'number') statusCursor.current = data.nextSeq;
+
         const statusArr = Array.isArray(data?.status) ? data.status : [data?.status];
         const messageArr = Array.isArray(data?.message) ? data.message : [data?.message];
         const tsArr = Array.isArray(data?.lastUpdated) ? data.lastUpdated : [data?.lastUpdated];
@@ -43,37 +77,13 @@ function App() {
           });
         }
 
-        if (events.length === 0) return;
-
-        const priority = { error: 3, active: 2, info: 1, idle: 0 };
-
-        const current = [...events].reduce((best, ev) => {
-          const bestScore = priority[(best.level || '').toLowerCase()] ?? 0;
-          const evScore = priority[(ev.level || '').toLowerCase()] ?? 0;
-
-          if (evScore > bestScore) return ev;
-          if (evScore === bestScore) {
-            const bestTs = best.ts ?? 0;
-            const evTs = ev.ts ?? 0;
-            if (evTs >= bestTs) return ev;
-          }
-          return best;
-        }, events[0]);
-
-        setStatus((prev) => {
-          const next = {
-            level: current.level || 'Idle',
-            text: current.text || '',
-            ts: current.ts || Date.now() / 1000,
-          };
-          if (prev.level === next.level && prev.text === next.text) return prev;
-          return next;
-        });
+        applyStatusEvents(events);
       })
       .catch(() => {});
-  }, []);
+  }, [applyStatusEvents]);
 
   const burstPollStatus = useCallback(() => {
+    if (eventStreamConnected.current) return;
     fetchStatus();
     setTimeout(fetchStatus, 400);
     setTimeout(fetchStatus, 900);
@@ -92,8 +102,15 @@ function App() {
 
   const fetchBooks = useCallback(() => {
     return fetch(`${apiBaseUrl}/api/scraper/get_books`)
-      .then((res) => res.json())
-      .then(([bookData, current]) => {
+      .then((res) => {
+        const version = Number(res.headers.get('X-Books-Version'));
+        return res.json().then((body) => [body, version]);
+      })
+      .then(([[bookData, current], version]) => {
+        if (Number.isFinite(version) && version > 0) {
+          if (version < booksVersion.current) return { bookData, current };
+          booksVersion.current = version;
+        }
         setBooks(bookData || {});
         setSelectedISBN(current || '');
         return { bookData, current };
@@ -211,11 +228,50 @@ function App() {
       })
       .catch(() => {});
 
+    let eventSource = null;
+    if (typeof window.EventSource === 'function') {
+      eventSource = new window.EventSource(`${apiBaseUrl}/api/events`);
+      eventSource.onopen = () => {
+        eventStreamConnected.current = true;
+      };
+      eventSource.onerror = () => {
+        eventStreamConnected.current = false;
+      };
+      eventSource.addEventListener('status', (e) => {
+        const data = JSON.parse(e.data || '{}');
+        if (typeof data.seq === 'number') statusCursor.current = Math.max(statusCursor.current, data.seq);
+        if (!data.status && !data.message) return;
+        applyStatusEvents([
+          {
+            level: String(data.status || 'Idle'),
+            text: data.message == null ? '' : String(data.message),
+            ts: typeof data.lastUpdated === 'number' ? data.lastUpdated : null,
+          },
+        ]);
+      });
+      eventSource.addEventListener('books', (e) => {
+        const data = JSON.parse(e.data || '{}');
+        if (typeof data.version === 'number') {
+          if (data.version < booksVersion.current) return;
+          booksVersion.current = data.version;
+        }
+        setBooks(data.books || {});
+        setSelectedISBN(data.currentIsbn || '');
+      });
+      eventSource.addEventListener('booksRefreshed', () => {
+        fetchBooks();
+      });
+    }
+
+    const pollStatusIfNoStream = () => {
+      if (!eventStreamConnected.current) fetchStatus();
+    };
+
     const handleVisibility = () => {
       if (document.visibilityState === 'visible') {
-        fetchStatus();
+        pollStatusIfNoStream();
         clearInterval(intervalRef.current);
-        intervalRef.current = setInterval(fetchStatus, 10000);
+        intervalRef.current = setInterval(pollStatusIfNoStream, 10000);
       } else {
         clearInterval(intervalRef.current);
       }
@@ -228,8 +284,9 @@ function App() {
       clearInterval(intervalRef.current);
       document.removeEventListener('visibilitychange', handleVisibility);
       clearTimeout(messageTimer.current);
+      if (eventSource) eventSource.close();
     };
-  }, [fetchStatus, fetchConfig, fetchBooks, burstPollStatus, showMessage]);
+  }, [fetchStatus, fetchConfig, fetchBooks, burstPollStatus, applyStatusEvents, showMessage]);
 
   if (!config) return <div style={{ padding: '20px' }}>Loading configuration...</div>;
 
@@ -342,6 +399,14 @@ function App() {
           </option>
         ))}
       </select>
+      {books[selectedISBN]?.coverArt && (
+        <img
+          className="cover-thumb"
+          src={`${apiBaseUrl}/api/cover?url=${encodeURIComponent(books[selectedISBN].coverArt)}&w=160`}
+          alt={`Cover of ${books[selectedISBN].title}`}
+          loading="lazy"
+        />
+      )}
 
       <div style={{ marginTop: '12px' }}>
         <label>